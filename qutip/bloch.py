@@ -1,9 +1,17 @@
 __all__ = ['Bloch']
 
+import math
 import os
+from collections import namedtuple
+from functools import wraps
+from hashlib import sha1
+from itertools import cycle, islice
 
-from numpy import (ndarray, array, linspace, pi, outer, cos, sin, ones, size,
-                   sqrt, real, mod, append, ceil, arange, sign)
+from numpy import (ndarray, array, linspace, pi, cos, sin, sqrt, real,
+                   sign, zeros_like, column_stack, argsort,
+                   stack, absolute, asarray, broadcast_to, concatenate, full,
+                   nan, empty, arange, negative, multiply,
+                   ascontiguousarray)
 
 from packaging.version import parse as parse_version
 
@@ -11,42 +19,291 @@ from qutip.qobj import Qobj
 from qutip.expect import expect
 from qutip.operators import sigmax, sigmay, sigmaz
 
-try:
-    import matplotlib
-    import matplotlib.pyplot as plt
-    from mpl_toolkits.mplot3d import Axes3D
-    from matplotlib.patches import FancyArrowPatch
-    from mpl_toolkits.mplot3d import proj3d
-
-    # Define a custom _axes3D function based on the matplotlib version.
-    # The auto_add_to_figure keyword is new for matplotlib>=3.4.
-    if parse_version(matplotlib.__version__) >= parse_version('3.4'):
-        def _axes3D(fig, *args, **kwargs):
-            ax = Axes3D(fig, *args, auto_add_to_figure=False, **kwargs)
-            return fig.add_axes(ax)
-    else:
-        def _axes3D(*args, **kwargs):
-            return Axes3D(*args, **kwargs)
+# matplotlib and IPython are only imported by _lazy_mpl, when a Bloch sphere
+# is first drawn, so that importing this module stays cheap.
+_MPL_NAMES = ('matplotlib', 'plt', 'proj3d', 'Line3DCollection', '_axes3D',
+              'Arrow3D', 'Arrow3DBatch', 'display')
+_mpl_loaded = False
+# Set by _lazy_mpl from the version of matplotlib.
+_MPL_GE_33 = _MPL_GE_34 = False
 
-    class Arrow3D(FancyArrowPatch):
-        def __init__(self, xs, ys, zs, *args, **kwargs):
-            FancyArrowPatch.__init__(self, (0, 0), (0, 0), *args, **kwargs)
 
-            self._verts3d = xs, ys, zs
+def _lazy_mpl():
+    """
+    Import matplotlib and IPython, and define the classes and functions
+    depending on them, into the module namespace.
+    """
+    global _mpl_loaded
+    global matplotlib, plt, proj3d, Line3DCollection, _axes3D
+    global Arrow3D, Arrow3DBatch, display, _MPL_GE_33, _MPL_GE_34
+    if _mpl_loaded:
+        return
+    _mpl_loaded = True
+
+    try:
+        import matplotlib
+        import matplotlib.pyplot as plt
+        from mpl_toolkits.mplot3d import Axes3D
+        from matplotlib.patches import FancyArrowPatch
+        from mpl_toolkits.mplot3d import proj3d
+        from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+        mpl_version = parse_version(matplotlib.__version__)
+        _MPL_GE_33 = mpl_version >= parse_version('3.3')
+        _MPL_GE_34 = mpl_version >= parse_version('3.4')
+
+        # Define a custom _axes3D function based on the matplotlib version.
+        # The auto_add_to_figure keyword is new for matplotlib>=3.4.
+        if _MPL_GE_34:
+            def _axes3D(fig, *args, **kwargs):
+                ax = Axes3D(fig, *args, auto_add_to_figure=False, **kwargs)
+                return fig.add_axes(ax)
+        else:
+            def _axes3D(*args, **kwargs):
+                return Axes3D(*args, **kwargs)
+
+        class Arrow3D(FancyArrowPatch):
+            def __init__(self, xs, ys, zs, *args, **kwargs):
+                FancyArrowPatch.__init__(self, (0, 0), (0, 0),
+                                         *args, **kwargs)
+                self.set_positions_3d(xs, ys, zs)
+
+            def set_positions_3d(self, xs, ys, zs):
+                """
+                Set the 3D coordinates of the start and end of the arrow.
+                """
+                self._verts3d = asarray(xs), asarray(ys), asarray(zs)
+                # (view matrix bytes, projected coordinates) of the last draw
+                self._proj_cache = (None, None)
+                self.stale = True
+
+            def _project(self):
+                """
+                Project the 3D end points with the current view matrix,
+                reusing the previous projection while the view is unchanged.
+                """
+                key = self.axes.M.tobytes()
+                if key != self._proj_cache[0]:
+                    xs3d, ys3d, zs3d = self._verts3d
+                    xs, ys, zs = proj3d.proj_transform(xs3d.ravel(),
+                                                       ys3d.ravel(),
+                                                       zs3d.ravel(),
+                                                       self.axes.M)
+                    shape = xs3d.shape
+                    self._proj_cache = (key, (xs.reshape(shape),
+                                              ys.reshape(shape),
+                                              zs.reshape(shape)))
+                return self._proj_cache[1]
+
+            def do_3d_projection(self, renderer=None):
+                # Used by matplotlib>=3.5 to sort the artists by depth.
+                return self._project()[2].min()
+
+            def draw(self, renderer):
+                xs, ys, zs = self._project()
+
+                self.set_positions((xs[0], ys[0]), (xs[1], ys[1]))
+                FancyArrowPatch.draw(self, renderer)
+
+        class Arrow3DBatch(Arrow3D):
+            """
+            Several 3D arrows sharing the same style, drawn by one artist.
+
+            ``segments`` is an array of shape ``(N, 2, 3)`` holding the start
+            and end point of each arrow and ``colors`` a sequence of ``N``
+            colors.
+            """
+            def __init__(self, segments, colors, *args, **kwargs):
+                Arrow3D.__init__(self, segments[..., 0], segments[..., 1],
+                                 segments[..., 2], *args, **kwargs)
+                self._colors = colors
+
+            def draw(self, renderer):
+                # All the end points are projected at once by _project.
+                xs, ys, zs = self._project()
+                for x, y, color in zip(xs, ys, self._colors):
+                    self.set_positions((x[0], y[0]), (x[1], y[1]))
+                    self.set_color(color)
+                    FancyArrowPatch.draw(self, renderer)
+    except:
+        pass
+
+    try:
+        from IPython.display import display
+    except:
+        pass
+
+
+def __getattr__(name):
+    if name in _MPL_NAMES:
+        _lazy_mpl()
+        if name in globals():
+            return globals()[name]
+    raise AttributeError("module {!r} has no attribute {!r}"
+                         .format(__name__, name))
+
+
+# Number of elements below which the numba kernels are not worth compiling,
+# and their plain NumPy implementation is used instead.
+_JIT_MIN_SIZE = 10000
+
+
+def _lazy_njit(signature, size):
+    """
+    Decorator compiling a function with numba, for the given signature, the
+    first time it is called on ``size(*args) >= _JIT_MIN_SIZE`` elements.
+    Smaller calls, and all calls without numba, run the plain function, so
+    that neither importing this module nor drawing small plots waits for a
+    compilation.
+    """
+    def decorator(func):
+        compiled = None
+
+        @wraps(func)
+        def wrapper(*args):
+            nonlocal compiled
+            if size(*args) < _JIT_MIN_SIZE:
+                return func(*args)
+            if compiled is None:
+                try:
+                    from numba import njit
+                except ImportError:
+                    compiled = func
+                else:
+                    compiled = njit(signature, cache=True,
+                                    fastmath=True)(func)
+            return compiled(*args)
+        return wrapper
+    return decorator
+
+
+def _digest(data):
+    """
+    Key identifying the contents of the array ``data``, cheap to store and
+    compare even for large arrays.
+    """
+    data = ascontiguousarray(data)
+    return data.shape, data.dtype.str, sha1(data).digest()
 
-        def draw(self, renderer):
-            xs3d, ys3d, zs3d = self._verts3d
-            xs, ys, zs = proj3d.proj_transform(xs3d, ys3d, zs3d, self.axes.M)
 
-            self.set_positions((xs[0], ys[0]), (xs[1], ys[1]))
-            FancyArrowPatch.draw(self, renderer)
-except:
-    pass
+def _fingerprint(value):
+    """
+    Hashable key comparing equal for data sets or styling options of equal
+    value, arrays being identified by their _digest.
+    """
+    if isinstance(value, ndarray):
+        if value.dtype.hasobject:
+            return _fingerprint(value.tolist())
+        return _digest(value)
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,
+                tuple(_fingerprint(item) for item in value))
+    if isinstance(value, dict):
+        return ('dict', tuple(sorted((repr(key), _fingerprint(item))
+                                     for key, item in value.items())))
+    return repr(value)
+
+
+# Records of the arcs, projections and trajectories added to a Bloch sphere.
+# ``opts`` holds the extra keyword arguments given when adding them.
+_Arc = namedtuple('_Arc', ['start_angle', 'end_angle', 'radius', 'dir',
+                           'z_angle', 'label', 'arrowhead', 'capstyle',
+                           'opts'])
+_Projection = namedtuple('_Projection', ['x', 'y', 'z', 'x_label', 'y_label',
+                                         'z_label', 'xy', 'offset', 'opts'])
+_Trajectory = namedtuple('_Trajectory', ['xs', 'ys', 'zs', 'arrowhead',
+                                         'capstyle', 'style', 'opts'])
+
+
+# Rotation matrices around the z axis used by plot_arcs, keyed by angle, and
+# the last one returned.
+_ROT2D_CACHE = {}
+_ROT2D_CACHE_SIZE = 256
+_last_rot2d = (None, None)
+
+
+def _rotation_2d(angle):
+    """
+    Return the (read-only) 2D rotation matrix of the given angle.
+    """
+    global _last_rot2d
+    if angle == _last_rot2d[0]:
+        return _last_rot2d[1]
+    rot = _ROT2D_CACHE.get(angle)
+    if rot is None:
+        if len(_ROT2D_CACHE) >= _ROT2D_CACHE_SIZE:
+            _ROT2D_CACHE.clear()
+        c, s = math.cos(angle), math.sin(angle)
+        rot = array(((c, -s), (s, c)))
+        rot.flags.writeable = False
+        _ROT2D_CACHE[angle] = rot
+    _last_rot2d = (angle, rot)
+    return rot
+
+
+# Ramp from 0 to 1 used to draw the projection lines.
+_UNIT_RAMP = linspace(0.0, 1.0, 100)
+_UNIT_RAMP.flags.writeable = False
+
+
+def _projection_path(start, corner, end):
+    """
+    Points, as a ``(3, 200)`` array, of the path going in straight lines
+    from ``start`` to ``corner`` and then to ``end``.
+    """
+    path = empty((3, 200))
+    for points, a, b in ((path[:, :100], start, corner),
+                         (path[:, 100:], corner, end)):
+        a = asarray(a, dtype=float)
+        multiply.outer(b - a, _UNIT_RAMP, out=points)
+        points += a[:, None]
+    return path
+
+
+# Pauli operators used to compute the Bloch vector of a state.
+_BLOCH_PAULIS = (sigmax(), sigmay(), sigmaz())
 
-try:
-    from IPython.display import display
-except:
-    pass
+
+@_lazy_njit('Tuple((f8[:], i8[:], b1))(f8[:, :])',
+            size=lambda pts: pts.shape[1])
+def _sort_by_radius(pts):
+    """
+    Distance to the origin of each column of the ``(3, N)`` array ``pts``,
+    the permutation sorting them from the closest to the furthest and
+    whether all the points lie on the same sphere.
+    """
+    dist = sqrt(pts[0] ** 2 + pts[1] ** 2 + pts[2] ** 2)
+    uniform = not (absolute(dist - dist[0]) > 1e-12 * dist[0]).any()
+    return dist, argsort(dist, kind='mergesort'), uniform
+
+
+@_lazy_njit('f8[:, :](f8, f8, i8, f8, f8, i8)',
+            size=lambda start, step, n, *args: n)
+def _arc_coords(start, step, n, radius, z_angle, axis):
+    """
+    Plotting coordinates, as a ``(3, n)`` array, of the points at angles
+    ``start + k * step`` on an arc of the given radius around the x, y or z
+    axis (``axis`` 0, 1 or 2), rotated by ``z_angle`` around the z axis
+    unless it lies in the xy plane.
+    """
+    u = start + step * arange(n)
+    xs = radius * cos(u)
+    ys = radius * sin(u)
+    out = empty((3, n))
+    if axis == 2:
+        out[0] = ys
+        out[1] = -xs
+        out[2] = 0.
+    else:
+        c, s = math.cos(z_angle), math.sin(z_angle)
+        if axis == 0:
+            out[0] = c * xs
+            out[1] = s * xs
+        else:
+            out[0] = s * xs
+            out[1] = -c * xs
+        out[2] = ys
+    return out
 
 
 class Bloch:
@@ -108,6 +365,13 @@ class Bloch:
     zlpos : list, default [1.2, -1.2]
         Positions of +z and -z labels respectively.
     """
+    # Sphere meshes shared by all instances, filled in by _get_sphere_mesh.
+    _SPHERE_MESH = None
+    # Data sets, drawn again without redrawing the sphere when only they
+    # changed.
+    _DATA_ATTRS = ('points', 'vectors', 'annotations', 'arcs', 'projections',
+                   'trajectories', 'point_style')
+
     def __init__(self, fig=None, axes=None, view=None, figsize=None,
                  background=False):
         # Figure and axes
@@ -193,6 +457,9 @@ class Bloch:
         self.point_marker = ['o', 's', 'd', '^']
 
         # ---data lists---
+        # Order from the origin of the point sets of the last render, keyed
+        # by their _digest
+        self._point_orders = {}
         # Data for point markers
         self.points = []
         # Data for Bloch vectors
@@ -210,8 +477,22 @@ class Bloch:
         # Style of points, 'm' for multiple colors, 's' for single color
         self.point_style = []
 
+        # Last image of each format returned by the _repr_*_ methods
+        self._repr_cache = {}
+
         # status of rendering
         self._rendered = False
+        # _repr_key of the last render
+        self._rendered_key = None
+        # Styling options of the last render, and the artists it added for
+        # the data sets and the front of the sphere
+        self._rendered_style = None
+        self._data_artists = []
+        self._front_lines = []
+        # Arrowheads of the arcs and trajectories of the last render, by
+        # index, moved to the new positions by the next data render
+        self._arc_arrows = {}
+        self._trajectory_arrows = {}
         # status of showing
         if fig is None:
             self._shown = False
@@ -274,51 +555,79 @@ class Bloch:
             raise Exception("No such convention.")
 
     def __str__(self):
-        s = ""
-        s += "Bloch data:\n"
-        s += "-----------\n"
-        s += "Number of points:  " + str(len(self.points)) + "\n"
-        s += "Number of vectors: " + str(len(self.vectors)) + "\n"
-        s += "\n"
-        s += "Bloch sphere properties:\n"
-        s += "------------------------\n"
-        s += "font_color:      " + str(self.font_color) + "\n"
-        s += "font_size:       " + str(self.font_size) + "\n"
-        s += "frame_alpha:     " + str(self.frame_alpha) + "\n"
-        s += "frame_color:     " + str(self.frame_color) + "\n"
-        s += "frame_width:     " + str(self.frame_width) + "\n"
-        s += "point_color:     " + str(self.point_color) + "\n"
-        s += "point_marker:    " + str(self.point_marker) + "\n"
-        s += "point_size:      " + str(self.point_size) + "\n"
-        s += "sphere_alpha:    " + str(self.sphere_alpha) + "\n"
-        s += "sphere_color:    " + str(self.sphere_color) + "\n"
-        s += "figsize:         " + str(self.figsize) + "\n"
-        s += "vector_color:    " + str(self.vector_color) + "\n"
-        s += "vector_width:    " + str(self.vector_width) + "\n"
-        s += "vector_style:    " + str(self.vector_style) + "\n"
-        s += "vector_mutation: " + str(self.vector_mutation) + "\n"
-        s += "view:            " + str(self.view) + "\n"
-        s += "xlabel:          " + str(self.xlabel) + "\n"
-        s += "xlpos:           " + str(self.xlpos) + "\n"
-        s += "ylabel:          " + str(self.ylabel) + "\n"
-        s += "ylpos:           " + str(self.ylpos) + "\n"
-        s += "zlabel:          " + str(self.zlabel) + "\n"
-        s += "zlpos:           " + str(self.zlpos) + "\n"
-        return s
+        lines = [
+            "Bloch data:",
+            "-----------",
+            "Number of points:  " + str(len(self.points)),
+            "Number of vectors: " + str(len(self.vectors)),
+            "",
+            "Bloch sphere properties:",
+            "------------------------",
+            "font_color:      " + str(self.font_color),
+            "font_size:       " + str(self.font_size),
+            "frame_alpha:     " + str(self.frame_alpha),
+            "frame_color:     " + str(self.frame_color),
+            "frame_width:     " + str(self.frame_width),
+            "point_color:     " + str(self.point_color),
+            "point_marker:    " + str(self.point_marker),
+            "point_size:      " + str(self.point_size),
+            "sphere_alpha:    " + str(self.sphere_alpha),
+            "sphere_color:    " + str(self.sphere_color),
+            "figsize:         " + str(self.figsize),
+            "vector_color:    " + str(self.vector_color),
+            "vector_width:    " + str(self.vector_width),
+            "vector_style:    " + str(self.vector_style),
+            "vector_mutation: " + str(self.vector_mutation),
+            "view:            " + str(self.view),
+            "xlabel:          " + str(self.xlabel),
+            "xlpos:           " + str(self.xlpos),
+            "ylabel:          " + str(self.ylabel),
+            "ylpos:           " + str(self.ylpos),
+            "zlabel:          " + str(self.zlabel),
+            "zlpos:           " + str(self.zlpos),
+        ]
+        return "\n".join(lines) + "\n"
+
+    def _style_key(self):
+        """
+        Styling options of the sphere, compared by value to know whether a
+        rendered figure is still up to date.
+        """
+        return tuple(sorted(
+            (name, _fingerprint(value)) for name, value in vars(self).items()
+            if not name.startswith('_') and name not in self._DATA_ATTRS
+            and name not in ('fig', 'axes', 'savenum')
+        ))
+
+    def _repr_key(self):
+        """
+        Key identifying what would be drawn by ``render``: the data sets and
+        the styling options, both compared by value so that changes made
+        directly to the attributes, including in place, are caught.
+        """
+        data = tuple(_fingerprint(getattr(self, name))
+                     for name in self._DATA_ATTRS)
+        return (data, self._style_key())
 
     def _repr_png_(self):
-        from IPython.core.pylabtools import print_figure
-        self.render()
-        fig_data = print_figure(self.fig, 'png')
-        plt.close(self.fig)
-        return fig_data
+        key = self._repr_key()
+        if self._repr_cache.get('png', (None,))[0] != key:
+            from IPython.core.pylabtools import print_figure
+            self.render()
+            fig_data = print_figure(self.fig, 'png')
+            plt.close(self.fig)
+            self._repr_cache['png'] = (key, fig_data)
+        return self._repr_cache['png'][1]
 
     def _repr_svg_(self):
-        from IPython.core.pylabtools import print_figure
-        self.render()
-        fig_data = print_figure(self.fig, 'svg').decode('utf-8')
-        plt.close(self.fig)
-        return fig_data
+        key = self._repr_key()
+        if self._repr_cache.get('svg', (None,))[0] != key:
+            from IPython.core.pylabtools import print_figure
+            self.render()
+            fig_data = print_figure(self.fig, 'svg').decode('utf-8')
+            plt.close(self.fig)
+            self._repr_cache['svg'] = (key, fig_data)
+        return self._repr_cache['svg'][1]
 
     def clear(self):
         """Resets Bloch sphere data sets to empty.
@@ -340,46 +649,37 @@ class Bloch:
             Type of points to plot, use 'm' for multicolored, 'l' for points
             connected with a line.
         """
-        if not isinstance(points[0], (list, ndarray)):
-            points = [[points[0]], [points[1]], [points[2]]]
         points = array(points)
-        if meth == 's':
-            if len(points[0]) == 1:
-                pnts = array([[points[0][0]], [points[1][0]], [points[2][0]]])
-                pnts = append(pnts, points, axis=1)
-            else:
-                pnts = points
-            self.points.append(pnts)
-            self.point_style.append('s')
-        elif meth == 'l':
-            self.points.append(points)
-            self.point_style.append('l')
-        else:
-            self.points.append(points)
-            self.point_style.append('m')
+        if points.ndim == 1:
+            # a single point
+            points = points[:, None]
+        if points.ndim != 2 or points.shape[0] != 3:
+            raise ValueError("Points must be given as x, y and z coordinates.")
+        self.points.append(points)
+        self.point_style.append(meth if meth in ('s', 'l') else 'm')
 
     def add_states(self, state, kind='vector'):
         """Add a state vector Qobj to Bloch sphere.
 
         Parameters
         ----------
-        state : Qobj
-            Input state vector.
+        state : Qobj or list of Qobj
+            Input state vector(s).
 
         kind : {'vector', 'point'}
             Type of object to plot.
         """
         if isinstance(state, Qobj):
             state = [state]
+        if len(state) == 0:
+            return
 
-        for st in state:
-            vec = [expect(sigmax(), st),
-                   expect(sigmay(), st),
-                   expect(sigmaz(), st)]
+        vecs = column_stack([expect(op, state) for op in _BLOCH_PAULIS])
 
-            if kind == 'vector':
-                self.add_vectors(vec)
-            elif kind == 'point':
+        if kind == 'vector':
+            self.add_vectors(vecs)
+        elif kind == 'point':
+            for vec in vecs:
                 self.add_points(vec)
 
     def add_vectors(self, vectors):
@@ -390,11 +690,11 @@ class Bloch:
         vectors : array_like
             Array with vectors of unit length or smaller.
         """
-        if isinstance(vectors[0], (list, ndarray)):
-            for vec in vectors:
-                self.vectors.append(vec)
-        else:
-            self.vectors.append(vectors)
+        vectors = array(vectors, ndmin=2)
+        if vectors.ndim != 2 or vectors.shape[1] != 3:
+            raise ValueError("Vectors must be given as x, y and z "
+                             "coordinates.")
+        self.vectors.extend(vectors)
 
     def add_annotation(self, state_or_vector, text, **kwargs):
         """
@@ -420,9 +720,7 @@ class Bloch:
 
         """
         if isinstance(state_or_vector, Qobj):
-            vec = [expect(sigmax(), state_or_vector),
-                   expect(sigmay(), state_or_vector),
-                   expect(sigmaz(), state_or_vector)]
+            vec = [expect(op, state_or_vector) for op in _BLOCH_PAULIS]
         elif isinstance(state_or_vector, (list, ndarray, tuple)) \
                 and len(state_or_vector) == 3:
             vec = state_or_vector
@@ -434,7 +732,7 @@ class Bloch:
                                  'opts': kwargs})
 
     def add_arc(self, start_angle, end_angle, radius=1.0, dir='z',
-                z_angle=0, label=None, arrowhead=False, arrowhead_pos=100,
+                z_angle=0.0, label=None, arrowhead=False, arrowhead_pos=100,
                 capstyle='butt', **kwargs):
         """
         Add an arc to Bloch sphere
@@ -470,12 +768,9 @@ class Bloch:
 
         """
         if arrowhead_pos == 100:
-            self.arcs.append({**{'start_angle': start_angle,
-                                 'end_angle': end_angle,
-                                 'radius': radius, 'dir': dir,
-                                 'z_angle': z_angle, 'label': label,
-                                 'arrowhead': arrowhead,
-                                 'capstyle': capstyle}, **kwargs})
+            self.arcs.append(_Arc(start_angle, end_angle, radius, dir,
+                                  z_angle, label, arrowhead, capstyle,
+                                  kwargs))
         else:
             mid_angle = (arrowhead_pos/100)*(end_angle-start_angle)
             mid_angle += start_angle
@@ -483,19 +778,12 @@ class Bloch:
                 label_1, label_2 = label, ''
             else:
                 label_1, label_2 = '', label
-            self.arcs.append({**{'start_angle': mid_angle,
-                                 'end_angle': end_angle,
-                                 'radius': radius, 'dir': dir,
-                                 'z_angle': z_angle, 'label': label_1,
-                                 'arrowhead': False,
-                                 'capstyle': capstyle}, **kwargs})
-            self.arcs.append({**{'start_angle': start_angle,
-                                 'end_angle': mid_angle,
-                                 'radius': radius, 'dir': dir,
-                                 'z_angle': z_angle, 'label': label_2,
-                                 'arrowhead': arrowhead,
-                                 'capstyle': capstyle}, **kwargs})
-        
+            self.arcs.append(_Arc(mid_angle, end_angle, radius, dir,
+                                  z_angle, label_1, False, capstyle, kwargs))
+            self.arcs.append(_Arc(start_angle, mid_angle, radius, dir,
+                                  z_angle, label_2, arrowhead, capstyle,
+                                  kwargs))
+
     def add_projection(self, x, y, z, x_label='', y_label='', z_label='',
                        xy=False, offset=0.2, **kwargs):
         """
@@ -524,13 +812,9 @@ class Bloch:
             fontsize, color, horizontalalignment, verticalalignment.
 
         """
-        self.projections.append({**{'x': x, 'y': y, 'z': z,
-                                    'x_label': x_label,
-                                    'y_label': y_label,
-                                    'z_label': z_label,
-                                    'xy': xy, 'offset': offset},
-                                    **kwargs})
-        
+        self.projections.append(_Projection(x, y, z, x_label, y_label,
+                                            z_label, xy, offset, kwargs))
+
     def add_trajectory(self, xs, ys, zs, arrowhead=False,
                        arrowhead_pos=100, capstyle='butt',
                        style='', **kwargs):
@@ -554,21 +838,20 @@ class Bloch:
 
         """
         style = style or self.trajectory_style
+        xs = asarray(xs, dtype=float)
+        ys = asarray(ys, dtype=float)
+        zs = asarray(zs, dtype=float)
         if arrowhead_pos == 100:
-            self.trajectories.append({**{'xs': xs, 'ys': ys, 'zs': zs,
-                                         'arrowhead': arrowhead,
-                                         'capstyle': capstyle,
-                                         'style': style}, **kwargs})
+            self.trajectories.append(_Trajectory(xs, ys, zs, arrowhead,
+                                                 capstyle, style, kwargs))
         else:
             mid = int(round(len(xs)*arrowhead_pos/100))
-            self.trajectories.append({**{'xs': xs[mid-1:], 'ys': ys[mid-1:],
-                                         'zs': zs[mid-1:], 'arrowhead': False,
-                                         'capstyle': capstyle,
-                                         'style': style}, **kwargs})
-            self.trajectories.append({**{'xs': xs[:mid], 'ys': ys[:mid],
-                                         'zs': zs[:mid], 'arrowhead': arrowhead,
-                                         'capstyle': capstyle,
-                                         'style': style}, **kwargs})
+            self.trajectories.append(_Trajectory(xs[mid-1:], ys[mid-1:],
+                                                 zs[mid-1:], False, capstyle,
+                                                 style, kwargs))
+            self.trajectories.append(_Trajectory(xs[:mid], ys[:mid],
+                                                 zs[:mid], arrowhead,
+                                                 capstyle, style, kwargs))
 
     def make_sphere(self):
         """
@@ -586,11 +869,26 @@ class Bloch:
     def render(self, fig=None, axes=None):
         """
         Render the Bloch sphere and its data sets in on given figure and axes.
+
+        When rendering again on the same figure and axes with unchanged
+        styling options, the sphere, frame and labels are kept and only the
+        data sets are drawn again, as long as the axes were not cleared
+        since the last render.
         """
+        _lazy_mpl()
+        self._rendered_key = self._repr_key()
+        style = self._rendered_key[1]
+        if (self._rendered and fig and axes is not None
+                and axes is self.axes and style == self._rendered_style
+                and self._front_lines and self._front_lines[0] in axes.lines):
+            self._render_data()
+            return
+
         if self._rendered:
             self.axes.clear()
 
         self._rendered = True
+        self._rendered_style = style
 
         # Figure instance for Bloch sphere plot
         if not fig:
@@ -613,82 +911,139 @@ class Bloch:
             self.axes.set_zlim3d(-0.7, 0.7)
         # Manually set aspect ratio to fit a square bounding box.
         # Matplotlib did this stretching for < 3.3.0, but not above.
-        if parse_version(matplotlib.__version__) >= parse_version('3.3'):
+        if _MPL_GE_33:
             self.axes.set_box_aspect((1, 1, 1))
 
         self.axes.grid(False)
+        self._arc_arrows = {}
+        self._trajectory_arrows = {}
         self.plot_back()
-        self.plot_arcs()
-        self.plot_projections()
-        self.plot_trajectories()
-        self.plot_points()
-        self.plot_vectors()
-        self.plot_front()
+        self._data_artists = self._plot_tracked(
+            self.plot_arcs, self.plot_projections, self.plot_trajectories,
+            self.plot_points, self.plot_vectors)
+        self._front_lines = [artist for artist
+                             in self._plot_tracked(self.plot_front)
+                             if artist in self.axes.lines]
         self.plot_axes_labels()
-        self.plot_annotations()
+        self._data_artists += self._plot_tracked(self.plot_annotations)
 
-    def plot_back(self):
-        # back half of sphere
-        u = linspace(0, pi, 25)
-        v = linspace(0, pi, 25)
-        x = outer(cos(u), sin(v))
-        y = outer(sin(u), sin(v))
-        z = outer(ones(size(u)), cos(v))
+    def _plot_tracked(self, *plot_functions):
+        """
+        Call the given plot functions and return the artists they added.
+        """
+        before = set(self.axes.get_children())
+        for plot in plot_functions:
+            plot()
+        return [artist for artist in self.axes.get_children()
+                if artist not in before]
+
+    def _add_arrowhead(self, arrows, k, xs, ys, zs, color):
+        """
+        Add the arrowhead ``k`` of the ``arrows`` dict of Arrow3D to the
+        axes, reusing the one drawn by the previous render if there is one.
+        """
+        arrow = arrows.get(k)
+        if arrow is None:
+            arrow = arrows[k] = Arrow3D(xs, ys, zs,
+                                        mutation_scale=self.vector_mutation,
+                                        lw=self.vector_width,
+                                        arrowstyle=self.vector_style,
+                                        color=color, shrinkA=0, shrinkB=0)
+        else:
+            arrow.set_positions_3d(xs, ys, zs)
+            arrow.set_color(color)
+        self.axes.add_artist(arrow)
+
+    def _render_data(self):
+        """
+        Replace the data sets of the last render, keeping the sphere.
+        """
+        for artist in self._data_artists:
+            artist.remove()
+        self._data_artists = self._plot_tracked(
+            self.plot_arcs, self.plot_projections, self.plot_trajectories,
+            self.plot_points, self.plot_vectors)
+        # Lines are drawn in insertion order: keep the front of the sphere
+        # above the data.
+        for line in self._front_lines:
+            line.remove()
+            self.axes.add_line(line)
+        self._data_artists += self._plot_tracked(self.plot_annotations)
+
+    @classmethod
+    def _get_sphere_mesh(cls, half):
+        """
+        Return the ``(x, y, z, cos_u, sin_u, frame)`` mesh of the ``'back'``
+        or ``'front'`` half of the sphere, ``frame`` being the lines of the
+        wireframe.  The meshes only depend on constants, so they are computed
+        once and shared between renders and instances.
+        """
+        if cls._SPHERE_MESH is None:
+            cls._SPHERE_MESH = {}
+        if half not in cls._SPHERE_MESH:
+            if half == 'back':
+                u = linspace(0, pi, 25)
+            else:
+                u = linspace(-pi, 0, 25)
+            v = linspace(0, pi, 25)
+            cos_u, sin_u = cos(u), sin(u)
+            cos_v, sin_v = cos(v), sin(v)
+            x = cos_u[:, None] * sin_v[None, :]
+            y = sin_u[:, None] * sin_v[None, :]
+            z = broadcast_to(cos_v[None, :], (u.size, v.size))
+            # every 4th line of constant u and of constant v
+            mesh = stack([x, y, z], axis=-1)
+            frame = concatenate([mesh[::4], mesh[:, ::4].swapaxes(0, 1)])
+            cls._SPHERE_MESH[half] = (x, y, z, cos_u, sin_u, frame)
+        return cls._SPHERE_MESH[half]
+
+    def _plot_half_sphere(self, half, equators):
+        x, y, z, cos_u, sin_u, frame = self._get_sphere_mesh(half)
         self.axes.plot_surface(x, y, z, rstride=2, cstride=2,
                                color=self.sphere_color, linewidth=0,
                                alpha=self.sphere_alpha)
         # wireframe
-        self.axes.plot_wireframe(x, y, z, rstride=4, cstride=4,
-                                 color=self.frame_color,
-                                 alpha=self.frame_alpha)
-        # equators
-        if 'z' in self.equators_back:
-            self.axes.plot(1.0 * cos(u), 1.0 * sin(u), zs=0, zdir='z',
-                        lw=self.frame_width, color=self.frame_color)
-        if 'y' in self.equators_back:
-            self.axes.plot(1.0 * cos(u), 1.0 * sin(u), zs=0, zdir='y',
-                        lw=self.frame_width, color=self.frame_color)
-        if 'x' in self.equators_back:
-            self.axes.plot(1.0 * cos(u), 1.0 * sin(u), zs=0, zdir='x',
-                        lw=self.frame_width, color=self.frame_color)
+        self.axes.add_collection3d(
+            Line3DCollection(frame, linewidths=self.frame_width,
+                             colors=self.frame_color, alpha=self.frame_alpha))
+        # equators, drawn as a single line
+        zero = zeros_like(cos_u)
+        lines = []
+        if 'z' in equators:
+            lines.append(column_stack((cos_u, sin_u, zero)))
+        if 'y' in equators:
+            lines.append(column_stack((cos_u, zero, sin_u)))
+        if 'x' in equators:
+            lines.append(column_stack((zero, cos_u, sin_u)))
+        self._plot_lines(lines, lw=self.frame_width, color=self.frame_color)
+
+    def plot_back(self):
+        # back half of sphere
+        self._plot_half_sphere('back', self.equators_back)
 
     def plot_front(self):
         # front half of sphere
-        u = linspace(-pi, 0, 25)
-        v = linspace(0, pi, 25)
-        x = outer(cos(u), sin(v))
-        y = outer(sin(u), sin(v))
-        z = outer(ones(size(u)), cos(v))
-        self.axes.plot_surface(x, y, z, rstride=2, cstride=2,
-                               color=self.sphere_color, linewidth=0,
-                               alpha=self.sphere_alpha)
-        # wireframe
-        self.axes.plot_wireframe(x, y, z, rstride=4, cstride=4,
-                                 color=self.frame_color,
-                                 alpha=self.frame_alpha)
-        # equators
-        if 'z' in self.equators_front:
-            self.axes.plot(1.0 * cos(u), 1.0 * sin(u),
-                        zs=0, zdir='z', lw=self.frame_width,
-                        color=self.frame_color)
-        if 'y' in self.equators_front:
-            self.axes.plot(1.0 * cos(u), 1.0 * sin(u),
-                        zs=0, zdir='y', lw=self.frame_width,
-                        color=self.frame_color)
-        if 'x' in self.equators_front:
-            self.axes.plot(1.0 * cos(u), 1.0 * sin(u),
-                        zs=0, zdir='x', lw=self.frame_width,
-                        color=self.frame_color)
+        self._plot_half_sphere('front', self.equators_front)
+
+    def _plot_lines(self, lines, **kwargs):
+        """
+        Draw 3D polylines as a single Line3D, separating them with NaNs.
+        Contrary to collections, lines are not depth-sorted by matplotlib
+        and stay below the sphere surfaces and the data.
+        """
+        if len(lines) == 0:
+            return
+        gap = full((1, 3), nan)
+        points = concatenate([part for line in lines for part in (gap, line)])
+        self.axes.plot(points[1:, 0], points[1:, 1], points[1:, 2], **kwargs)
 
     def plot_axes(self):
         # axes
-        span = linspace(-1.0, 1.0, 2)
-        self.axes.plot(span, 0 * span, zs=0, zdir='z', label='X',
-                       lw=self.frame_width, color=self.frame_color)
-        self.axes.plot(0 * span, span, zs=0, zdir='z', label='Y',
-                       lw=self.frame_width, color=self.frame_color)
-        self.axes.plot(0 * span, span, zs=0, zdir='y', label='Z',
-                       lw=self.frame_width, color=self.frame_color)
+        segments = array([[[-1, 0, 0], [1, 0, 0]],
+                          [[0, -1, 0], [0, 1, 0]],
+                          [[0, 0, -1], [0, 0, 1]]], dtype=float)
+        self._plot_lines(segments, lw=self.frame_width,
+                         color=self.frame_color)
 
     def plot_axes_labels(self):
         # axes labels
@@ -705,226 +1060,221 @@ class Bloch:
         self.axes.text(0, 0, self.zlpos[0], self.zlabel[0], **opts)
         self.axes.text(0, 0, self.zlpos[1], self.zlabel[1], **opts)
 
-        for a in (self.axes.w_xaxis.get_ticklines() +
-                  self.axes.w_xaxis.get_ticklabels()):
-            a.set_visible(False)
-        for a in (self.axes.w_yaxis.get_ticklines() +
-                  self.axes.w_yaxis.get_ticklabels()):
-            a.set_visible(False)
-        for a in (self.axes.w_zaxis.get_ticklines() +
-                  self.axes.w_zaxis.get_ticklabels()):
-            a.set_visible(False)
+        # no ticks at all, rather than hiding each tick artist
+        for axis in (self.axes.xaxis, self.axes.yaxis, self.axes.zaxis):
+            axis.set_ticks([])
 
     def plot_vectors(self):
+        if len(self.vectors) == 0:
+            return
+        vectors = real(array(self.vectors)).reshape(-1, 3)
         # -X and Y data are switched for plotting purposes
-        for k in range(len(self.vectors)):
-
-            xs3d = self.vectors[k][1] * array([0, 1])
-            ys3d = -self.vectors[k][0] * array([0, 1])
-            zs3d = self.vectors[k][2] * array([0, 1])
-
-            color = self.vector_color[mod(k, len(self.vector_color))]
-
-            if self.vector_style == '':
-                # simple line style
-                self.axes.plot(xs3d, ys3d, zs3d,
-                               zs=0, zdir='z', label='Z',
-                               lw=self.vector_width, color=color)
-            else:
-                # decorated style, with arrow heads
-                a = Arrow3D(xs3d, ys3d, zs3d,
-                            mutation_scale=self.vector_mutation,
-                            lw=self.vector_width,
-                            arrowstyle=self.vector_style,
-                            color=color)
+        ends = vectors[:, [1, 0, 2]] * array([1, -1, 1])
+        segments = stack([zeros_like(ends), ends], axis=1)
+        colors = list(islice(cycle(self.vector_color), len(vectors)))
+
+        if self.vector_style == '':
+            # simple line style
+            self.axes.add_collection3d(
+                Line3DCollection(segments, linewidths=self.vector_width,
+                                 colors=colors))
+        else:
+            # decorated style, with arrow heads
+            a = Arrow3DBatch(segments, colors,
+                             mutation_scale=self.vector_mutation,
+                             lw=self.vector_width,
+                             arrowstyle=self.vector_style)
 
-                self.axes.add_artist(a)
+            self.axes.add_artist(a)
 
     def plot_points(self):
         # -X and Y data are switched for plotting purposes
-        for k in range(len(self.points)):
-            num = len(self.points[k][0])
-            dist = [sqrt(self.points[k][0][j] ** 2 +
-                         self.points[k][1][j] ** 2 +
-                         self.points[k][2][j] ** 2) for j in range(num)]
-            if any(abs(dist - dist[0]) / dist[0] > 1e-12):
-                # combine arrays so that they can be sorted together
-                zipped = list(zip(dist, range(num)))
-                zipped.sort()  # sort rates from lowest to highest
-                dist, indperm = zip(*zipped)
-                indperm = array(indperm)
-            else:
-                indperm = arange(num)
-            if self.point_style[k] == 's':
-                self.axes.scatter(
-                    real(self.points[k][1][indperm]),
-                    - real(self.points[k][0][indperm]),
-                    real(self.points[k][2][indperm]),
-                    s=self.point_size[mod(k, len(self.point_size))],
-                    alpha=1,
-                    edgecolor=None,
-                    zdir='z',
-                    color=self.point_color[mod(k, len(self.point_color))],
-                    marker=self.point_marker[mod(k, len(self.point_marker))])
-
-            elif self.point_style[k] == 'm':
-                pnt_colors = array(self.point_color *
-                                   int(ceil(num / float(len(self.point_color)))))
-
-                pnt_colors = pnt_colors[0:num]
-                pnt_colors = list(pnt_colors[indperm])
-                marker = self.point_marker[mod(k, len(self.point_marker))]
-                s = self.point_size[mod(k, len(self.point_size))]
-                self.axes.scatter(real(self.points[k][1][indperm]),
-                                  -real(self.points[k][0][indperm]),
-                                  real(self.points[k][2][indperm]),
-                                  s=s, alpha=1, edgecolor=None,
-                                  zdir='z', color=pnt_colors,
-                                  marker=marker)
-
-            elif self.point_style[k] == 'l':
-                color = self.point_color[mod(k, len(self.point_color))]
-                self.axes.plot(real(self.points[k][1]),
-                               -real(self.points[k][0]),
-                               real(self.points[k][2]),
+        # Scattered point sets sharing a style, marker and size are drawn
+        # with a single scatter call.
+        groups = {}
+        point_rgba = matplotlib.colors.to_rgba_array(self.point_color)
+        # the order of the point sets already plotted by the last render is
+        # reused, as long as their contents are unchanged
+        orders = {}
+        for pts, style, color, marker, size in zip(
+                self.points, self.point_style, cycle(self.point_color),
+                cycle(self.point_marker), cycle(self.point_size)):
+            pts = ascontiguousarray(real(pts), dtype=float)
+            num = pts.shape[1]
+            if style == 'l':
+                self.axes.plot(pts[1], -pts[0], pts[2],
                                alpha=0.75, zdir='z',
                                color=color)
+                continue
+
+            key = _digest(pts)
+            if key not in orders:
+                orders[key] = (self._point_orders.get(key)
+                               or _sort_by_radius(pts)[1:])
+            order, uniform = orders[key]
+            # points in plotting coordinates (y, -x, z), sorted from the
+            # closest to the furthest from origin, extracted in one copy
+            if uniform:
+                xyz = pts[[1, 0, 2]]
+            else:
+                xyz = pts[[[1], [0], [2]], order]
+            negative(xyz[1], out=xyz[1])
+            if style == 's':
+                colors = color
+            else:
+                # colors cycle over the points in insertion order
+                colors = point_rgba.take(arange(num) if uniform else order,
+                                         axis=0, mode='wrap')
+            groups.setdefault((style, marker, size), []).append((xyz, colors))
+
+        for (_, marker, s), members in groups.items():
+            if len(members) == 1:
+                xyz, colors = members[0]
+            else:
+                xyz = concatenate([p for p, _ in members], axis=1)
+                colors = concatenate([
+                    broadcast_to(matplotlib.colors.to_rgba_array(c),
+                                 (p.shape[1], 4))
+                    for p, c in members])
+            self.axes.scatter(*xyz,
+                              s=s, alpha=1, edgecolor=None,
+                              zdir='z', color=colors,
+                              marker=marker)
+        self._point_orders = orders
 
     def plot_annotations(self):
         # -X and Y data are switched for plotting purposes
+        base_opts = {'fontsize': self.font_size,
+                     'color': self.font_color,
+                     'horizontalalignment': 'center',
+                     'verticalalignment': 'center'}
+        # text options merged once for each distinct set of (hashable)
+        # annotation options
+        merged_opts = {frozenset(): base_opts}
         for annotation in self.annotations:
             vec = annotation['position']
-            opts = {'fontsize': self.font_size,
-                    'color': self.font_color,
-                    'horizontalalignment': 'center',
-                    'verticalalignment': 'center'}
-            opts.update(annotation['opts'])
+            try:
+                key = frozenset(annotation['opts'].items())
+            except TypeError:
+                key = None
+            opts = merged_opts.get(key)
+            if opts is None:
+                opts = {**base_opts, **annotation['opts']}
+                if key is not None:
+                    merged_opts[key] = opts
             self.axes.text(vec[1], -vec[0], vec[2],
                            annotation['text'], **opts)
 
     def plot_arcs(self):
-        swap = {'x': 'y', 'y': 'x', 'z': 'z'}
-        for k, arc in enumerate(self.arcs):
-            angle_degrees = abs(arc['end_angle']-arc['start_angle']) / pi * 180
+        for k, (arc, color) in enumerate(zip(self.arcs,
+                                             cycle(self.arc_color))):
+            angle_degrees = abs(arc.end_angle-arc.start_angle) / pi * 180
             n_points = int(round(angle_degrees))
-            u = linspace(arc['start_angle'], arc['end_angle'], n_points)
-            u = array([*u, u[-1]+(u[-1]-u[-2])])
-            n_points += 1
-            xs = arc['radius'] * cos(u)
-            ys = arc['radius'] * sin(u)
-            color = self.arc_color[mod(k, len(self.arc_color))]
-            c, s = cos(arc['z_angle']), sin(arc['z_angle'])
-            rot = array(((c, -s), (s, c)))
+            # points from start_angle to end_angle, and one step past the end
+            # giving the direction of the arrowhead if there is one
+            step = (arc.end_angle - arc.start_angle) / (n_points - 1)
+            # floats, matching the signature of the compiled kernel
+            pts = _arc_coords(float(arc.start_angle), float(step),
+                              n_points + 1 if arc.arrowhead else n_points,
+                              float(arc.radius), float(arc.z_angle),
+                              'xyz'.index(arc.dir))
+            self.axes.plot(*pts[:, :n_points],
+                           lw=self.arc_width, color=color,
+                           solid_capstyle=arc.capstyle,
+                           dash_capstyle=arc.capstyle)
+
+            if arc.arrowhead:
+                self._add_arrowhead(self._arc_arrows, k, pts[0, -3::2],
+                                    pts[1, -3::2], pts[2, -3::2], color)
             
-            if swap[arc['dir']] == 'x':
-                a, b = rot.dot(array([[0]*n_points, -xs]))
-                self.axes.plot(a[:-1], b[:-1], zs=ys[:-1],
-                               lw=self.arc_width, color=color,
-                               solid_capstyle=arc.get('capstyle'),
-                               dash_capstyle=arc.get('capstyle'))
-                xs3d = array([a[-3], a[-1]])
-                ys3d = array([b[-3], b[-1]])
-                zs3d = array([ys[-3], ys[-1]])
-            if swap[arc['dir']] == 'y':
-                a, b = rot.dot(array([xs, [0]*n_points]))
-                self.axes.plot(a[:-1], b[:-1], zs=ys[:-1],
-                               lw=self.arc_width, color=color,
-                               solid_capstyle=arc.get('capstyle'),
-                               dash_capstyle=arc.get('capstyle'))
-                xs3d = array([a[-3], a[-1]])
-                ys3d = array([b[-3], b[-1]])
-                zs3d = array([ys[-3], ys[-1]])
-            if swap[arc['dir']] == 'z':
-                self.axes.plot(ys[:-1], -xs[:-1], zs=0,
-                               lw=self.arc_width, color=color,
-                               solid_capstyle=arc.get('capstyle'),
-                               dash_capstyle=arc.get('capstyle'))
-                xs3d = array([ys[-3], ys[-1]])
-                ys3d = array([-xs[-3], -xs[-1]])
-                zs3d = array([0, 0])
-            
-            if arc.get('arrowhead'):
-                a = Arrow3D(xs3d, ys3d, zs3d,
-                            mutation_scale=self.vector_mutation,
-                            lw=self.vector_width,
-                            arrowstyle=self.vector_style,
-                            color=color, shrinkA=0, shrinkB=0)
-                
-                self.axes.add_artist(a)
-            
-            if arc.get('label'):
-                xs = (arc['radius']+0.2) * cos(u)
-                ys = (arc['radius']+0.2) * sin(u)
+            if arc.label:
+                rot = _rotation_2d(arc.z_angle)
+                mid_angle = arc.start_angle + step * ((n_points + 1) // 2)
+                xm = (arc.radius+0.2) * math.cos(mid_angle)
+                ym = (arc.radius+0.2) * math.sin(mid_angle)
                 opts = {'fontsize': self.font_size,
                         'color': self.font_color,
                         'horizontalalignment': 'center',
                         'verticalalignment': 'center'}
-                
-                if swap[arc['dir']] == 'x':
-                    a, b = rot.dot(array([0, -xs[n_points//2]]))
-                    self.axes.text(a, b, ys[n_points//2],
-                                   arc['label'], **opts)
-                if swap[arc['dir']] == 'y':
-                    a, b = rot.dot(array([xs[n_points//2], 0]))
-                    self.axes.text(a, b, ys[n_points//2],
-                                   arc['label'], **opts)
-                if swap[arc['dir']] == 'z':
-                    self.axes.text(ys[n_points//2], -xs[n_points//2], 0,
-                                   arc['label'], **opts)
+
+                # rotating (xm, 0) or (0, -xm) scales a column of rot
+                if arc.dir == 'x':
+                    position = (*(xm * rot[:, 0]), ym)
+                elif arc.dir == 'y':
+                    position = (*(-xm * rot[:, 1]), ym)
+                else:
+                    position = (ym, -xm, 0)
+                self.axes.text(*position, arc.label, **opts)
                     
     def plot_projections(self):
-        for k, projection in enumerate(self.projections):
-            x, y, z, x_lbl, y_lbl, z_lbl, xy, offset = (
-                projection.get('x'), projection.get('y'),
-                projection.get('z'), projection.get('x_label'),
-                projection.get('y_label'), projection.get('z_label'),
-                projection.get('xy'), projection.get('offset'))
-            color = self.projection_color[mod(k, len(self.projection_color))]
+        text_opts = {'fontsize': self.font_size,
+                     'color': self.font_color,
+                     'horizontalalignment': 'center',
+                     'verticalalignment': 'center'}
+
+        def add_label(vec, text):
+            # -X and Y data are switched for plotting purposes. The labels
+            # are drawn directly, not through add_annotation, so that
+            # rendering does not modify the data sets.
+            self.axes.text(vec[1], -vec[0], vec[2], text, **text_opts)
+
+        for projection, color in zip(self.projections,
+                                     cycle(self.projection_color)):
+            x, y, z, x_lbl, y_lbl, z_lbl, xy, offset, _ = projection
             opts = {'color': color,
                     'lw': self.projection_width,
                     'ls': self.projection_style}
-            self.axes.plot([*linspace(0, x, 100)] + [x]*100,
-                           [*linspace(0, y, 100)] + [y]*100,
-                           [0]*100 + [*linspace(0, z, 100)],
+            self.axes.plot(*_projection_path((0, 0, 0), (x, y, 0), (x, y, z)),
                            solid_capstyle='butt', dash_capstyle='butt', **opts)
             if z_lbl:
-                t = offset/sqrt(x**2+y**2)
-                self.add_annotation([-y*(1+t), x*(1+t), z/2], z_lbl)
+                r = math.hypot(x, y)
+                if r:
+                    t = offset/r
+                    position = [-y*(1+t), x*(1+t), z/2]
+                else:
+                    # projection on the z axis: put the label beside it
+                    position = [0, offset, z/2]
+                add_label(position, z_lbl)
             if xy:
-                self.axes.plot([*linspace(0, x, 100)] + [x]*100,
-                               [y]*100 + [*linspace(y, 0, 100)],
-                               [0]*200, solid_capstyle='butt',
-                               dash_capstyle='butt', **opts)
+                self.axes.plot(*_projection_path((0, y, 0), (x, y, 0),
+                                                 (x, 0, 0)),
+                               solid_capstyle='butt', dash_capstyle='butt',
+                               **opts)
                 if x_lbl:
-                    self.add_annotation([-y/2, x+offset*sign(x), 0], x_lbl)
+                    add_label([-y/2, x+offset*sign(x), 0], x_lbl)
                 if y_lbl:
-                    self.add_annotation([-y-offset*sign(y), x/2, 0], y_lbl)
+                    add_label([-y-offset*sign(y), x/2, 0], y_lbl)
                     
     def plot_trajectories(self):
-        for k, trajectory in enumerate(self.trajectories):
-            color = self.trajectory_color[mod(k, len(self.trajectory_color))]
+        for k, (trajectory, color) in enumerate(
+                zip(self.trajectories, cycle(self.trajectory_color))):
             opts = {'color': color,
                     'lw': self.trajectory_width,
-                    'ls': trajectory.get('style')}
-            xs = array(trajectory.get('xs'))
-            ys = array(trajectory.get('ys'))
-            zs = array(trajectory.get('zs'))
+                    'ls': trajectory.style}
+            xs, ys, zs = trajectory.xs, trajectory.ys, trajectory.zs
             self.axes.plot(ys, -xs, zs, **opts,
-                           solid_capstyle=trajectory.get('capstyle'),
-                           dash_capstyle=trajectory.get('capstyle'))
-            if trajectory.get('arrowhead'):
-                a = Arrow3D(ys[-2:], -xs[-2:], zs[-2:],
-                            mutation_scale=self.vector_mutation,
-                            lw=self.vector_width,
-                            arrowstyle=self.vector_style,
-                            color=color, shrinkA=0, shrinkB=0)
-                self.axes.add_artist(a)
+                           solid_capstyle=trajectory.capstyle,
+                           dash_capstyle=trajectory.capstyle)
+            if trajectory.arrowhead:
+                self._add_arrowhead(self._trajectory_arrows, k, ys[-2:],
+                                    -xs[-2:], zs[-2:], color)
 
     def show(self):
         """
         Display Bloch sphere and corresponding data sets.
+
+        The figure is only rendered again if the data sets or the styling
+        options changed since the last render, or if it was closed, e.g. by
+        ``save``.
         """
-        self.render(self.fig, self.axes)
+        _lazy_mpl()
+        number = getattr(self.fig, 'number', None)
+        if self.fig is None or (number is not None
+                                and not plt.fignum_exists(number)):
+            # draw on a new figure
+            self.render()
+        elif self._rendered_key != self._repr_key():
+            self.render(self.fig, self.axes)
         if self.run_from_ipython():
             if self._shown:
                 display(self.fig)
@@ -932,7 +1282,8 @@ class Bloch:
             self.fig.show()
         self._shown = True
 
-    def save(self, name=None, format='png', dirc=None, dpin=None):
+    def save(self, name=None, format='png', dirc=None, dpin=None,
+             close=True):
         """Saves Bloch sphere to file of type ``format`` in directory ``dirc``.
 
         Parameters
@@ -948,6 +1299,9 @@ class Bloch:
             Directory for output images. Defaults to current working directory.
         dpin : int
             Resolution in dots per inch.
+        close : bool
+            Close the figure with pyplot after saving it. Pass ``False`` to
+            keep it open, e.g. to show it or to save further frames.
 
         Returns
         -------
@@ -976,7 +1330,7 @@ class Bloch:
         else:
             self.fig.savefig(complete_path)
         self.savenum += 1
-        if self.fig:
+        if close and self.fig:
             plt.close(self.fig)
 
 
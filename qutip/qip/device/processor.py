@@ -1,10 +1,14 @@
 from collections.abc import Iterable
 import warnings
-from copy import deepcopy
 
 import numpy as np
+import scipy
 from scipy.interpolate import CubicSpline
+from scipy.linalg import expm
+from scipy.sparse.linalg import expm_multiply
+from packaging.version import parse as parse_version
 
+import qutip.settings as settings
 from qutip.qobj import Qobj
 from qutip.qobjevo import QobjEvo
 from qutip.operators import identity
@@ -21,6 +25,9 @@ from qutip.qip.pulse import Pulse, Drift, _merge_qobjevo, _fill_coeff
 
 __all__ = ['Processor']
 
+# scipy.linalg.expm accepts stacks of matrices from scipy 1.9
+_BATCHED_EXPM = parse_version(scipy.__version__) >= parse_version("1.9")
+
 
 class Processor(object):
     """
@@ -98,10 +105,13 @@ class Processor(object):
                  dims=None, spline_kind="step_func"):
         self.N = N
         self.pulses = []
+        self._checked_pulses = []
+        self._pulse_classes = None
         self.t1 = t1
         self.t2 = t2
         self.noise = []
         self.drift = Drift()
+        self._drift_cache = None
         if dims is None:
             self.dims = [2] * N
         else:
@@ -146,6 +156,7 @@ class Processor(object):
                 self.drift.add_drift(qobj, temp_targets)
         else:
             self.drift.add_drift(qobj, targets)
+        self._drift_cache = None
 
     def add_control(self, qobj, targets=None, cyclic_permutation=False,
                     label=None):
@@ -278,11 +289,12 @@ class Processor(object):
                       for pulse in self.pulses if pulse.tlist is not None]
         if not full_tlist:
             return None
-        full_tlist = np.unique(np.sort(np.hstack(full_tlist)))
-        # account for inaccuracy in float-point number
-        full_tlist = np.concatenate(
-            (full_tlist[:1], full_tlist[1:][np.diff(full_tlist) > tol]))
-        return full_tlist
+        full_tlist = np.sort(np.hstack(full_tlist))
+        # drop repeated times, accounting for inaccuracy in float-point number
+        keep = np.empty(full_tlist.shape, dtype=bool)
+        keep[:1] = True
+        np.greater(np.diff(full_tlist), tol, out=keep[1:])
+        return full_tlist[keep]
 
     def get_full_coeffs(self, full_tlist=None):
         """
@@ -304,31 +316,56 @@ class Processor(object):
             return np.array((0, 0), dtype=float)
         if full_tlist is None:
             full_tlist = self.get_full_tlist()
-        coeffs_list = []
-        for pulse in self.pulses:
+        # rows of the pulses that are turned off are left to zero
+        on_inds, array_inds = self._classify_pulses()
+        dtype = np.result_type(
+            float, *[self.pulses[i].coeff for i in array_inds])
+        coeffs = np.zeros((len(self.pulses), len(full_tlist)), dtype=dtype)
+        coeffs[on_inds] = 1.
+        if not array_inds:
+            return coeffs
+        if self.spline_kind == "step_func":
+            arg = {"_step_func_coeff": True}
+        elif self.spline_kind == "cubic":
+            arg = {}
+        else:
+            raise ValueError("Unknown spline kind.")
+        for i in array_inds:
+            pulse = self.pulses[i]
+            coeffs[i] = _fill_coeff(pulse.coeff, pulse.tlist, full_tlist, arg)
+        return coeffs
+
+    def _classify_pulses(self):
+        """
+        Sort the pulses by the type of their coefficient, for
+        `get_full_coeffs`. The result is kept until the pulses are
+        changed, see `_is_pulses_valid`.
+
+        Returns
+        -------
+        on_inds: list of int
+            Indices of the pulses with ``coeff=True``.
+        array_inds: list of int
+            Indices of the pulses with a NumPy array as coeff.
+        """
+        if self._pulse_classes is not None:
+            return self._pulse_classes
+        on_inds = []
+        array_inds = []
+        for i, pulse in enumerate(self.pulses):
             if pulse.tlist is None and pulse.coeff is None:
-                coeffs_list.append(np.zeros(len(full_tlist)))
                 continue
-            if not isinstance(pulse.coeff, (bool, np.ndarray)):
-                raise ValueError(
-                    "get_full_coeffs only works for "
-                    "NumPy array or bool coeff.")
             if isinstance(pulse.coeff, bool):
                 if pulse.coeff:
-                    coeffs_list.append(np.ones(len(full_tlist)))
-                else:
-                    coeffs_list.append(np.zeros(len(full_tlist)))
-                continue
-            if self.spline_kind == "step_func":
-                arg = {"_step_func_coeff": True}
-                coeffs_list.append(
-                    _fill_coeff(pulse.coeff, pulse.tlist, full_tlist, arg))
-            elif self.spline_kind == "cubic":
-                coeffs_list.append(
-                    _fill_coeff(pulse.coeff, pulse.tlist, full_tlist, {}))
+                    on_inds.append(i)
+            elif isinstance(pulse.coeff, np.ndarray):
+                array_inds.append(i)
             else:
-                raise ValueError("Unknown spline kind.")
-        return np.array(coeffs_list)
+                raise ValueError(
+                    "get_full_coeffs only works for "
+                    "NumPy array or bool coeff.")
+        self._pulse_classes = (on_inds, array_inds)
+        return self._pulse_classes
 
     def set_all_tlist(self, tlist):
         """
@@ -377,13 +414,13 @@ class Processor(object):
         if indices is not None:
             if not isinstance(indices, Iterable):
                 indices = [indices]
-            indices.sort(reverse=True)
+            keep = [True] * len(self.pulses)
             for ind in indices:
-                del self.pulses[ind]
+                keep[ind] = False
         else:
-            for ind, pulse in enumerate(self.pulses):
-                if pulse.label == label:
-                    del self.pulses[ind]
+            keep = [pulse.label != label for pulse in self.pulses]
+        self.pulses = [
+            pulse for pulse, kept in zip(self.pulses, keep) if kept]
 
     def _is_pulses_valid(self):
         """
@@ -392,6 +429,15 @@ class Processor(object):
         Returns: bool
             If they are valid or not
         """
+        # the check is only repeated if a pulse has been given a new
+        # coefficient, time sequence or spline kind since the last call
+        checked = [(pulse.coeff, pulse.tlist, pulse.spline_kind)
+                   for pulse in self.pulses]
+        if len(checked) == len(self._checked_pulses) and all(
+                new is old
+                for new_attrs, old_attrs in zip(checked, self._checked_pulses)
+                for new, old in zip(new_attrs, old_attrs)):
+            return True
         for i, pulse in enumerate(self.pulses):
             if pulse.coeff is None or isinstance(pulse.coeff, bool):
                 # constant pulse
@@ -424,6 +470,8 @@ class Processor(object):
                         "The length of tlist and coeff of the pulse "
                         "labelled {} is invalid. "
                         "It should be either len(tlist)=len(coeff)".format(i))
+        self._checked_pulses = checked
+        self._pulse_classes = None
         return True
 
     def add_noise(self, noise):
@@ -440,7 +488,7 @@ class Processor(object):
         else:
             raise TypeError("Input is not a Noise object.")
 
-    def save_coeff(self, file_name, inctime=True):
+    def save_coeff(self, file_name, inctime=True, binary=False):
         """
         Save a file with the control amplitudes in each timeslot.
 
@@ -451,20 +499,30 @@ class Processor(object):
 
         inctime: bool, optional
             True if the time list should be included in the first column.
+
+        binary: bool, optional
+            If true, save the table in the binary NumPy ``.npy`` format
+            instead of as text. It is faster to write and read, and exact.
         """
         self._is_pulses_valid()
-        coeffs = np.array(self.get_full_coeffs())
+        tlist = self.get_full_tlist()
+        coeffs = self.get_full_coeffs(tlist)
         if inctime:
             shp = coeffs.T.shape
             data = np.empty((shp[0], shp[1] + 1), dtype=np.float64)
-            data[:, 0] = self.get_full_tlist()
+            data[:, 0] = tlist
             data[:, 1:] = coeffs.T
         else:
             data = coeffs.T
 
-        np.savetxt(file_name, data, delimiter='\t', fmt='%1.16f')
+        if binary:
+            # through a file object, np.save does not add an extension
+            with open(file_name, 'wb') as f:
+                np.save(f, data)
+        else:
+            np.savetxt(file_name, data, delimiter='\t', fmt='%1.16f')
 
-    def read_coeff(self, file_name, inctime=True):
+    def read_coeff(self, file_name, inctime=True, binary=False):
         """
         Read the control amplitudes matrix and time list
         saved in the file by `save_amp`.
@@ -477,6 +535,9 @@ class Processor(object):
         inctime: bool, optional
             True if the time list in included in the first column.
 
+        binary: bool, optional
+            True if the file was saved with ``binary=True``.
+
         Returns
         -------
         tlist: array_like
@@ -485,7 +546,10 @@ class Processor(object):
         coeffs: array_like
             The pulse matrix read from the file.
         """
-        data = np.loadtxt(file_name, delimiter='\t')
+        if binary:
+            data = np.load(file_name)
+        else:
+            data = np.loadtxt(file_name, delimiter='\t')
         if not inctime:
             self.coeffs = data.T
             return self.coeffs
@@ -517,9 +581,9 @@ class Processor(object):
         noisy_pulses: list of :class:`.Pulse`
             A list of noisy pulses.
         """
-        pulses = deepcopy(self.pulses)
+        # process_noise works on copies of the pulses
         noisy_pulses = process_noise(
-            pulses, self.noise, self.dims, t1=self.t1, t2=self.t2,
+            self.pulses, self.noise, self.dims, t1=self.t1, t2=self.t2,
             device_noise=device_noise)
         if drift:
             noisy_pulses += [self.drift]
@@ -550,12 +614,6 @@ class Processor(object):
         # check validity
         self._is_pulses_valid()
 
-        if args is None:
-            args = {}
-        else:
-            args = args
-        # set step function
-
         if not noisy:
             dynamics = self.pulses
         else:
@@ -566,27 +624,39 @@ class Processor(object):
         c_ops = []
         for pulse in dynamics:
             if noisy:
-                qu, new_c_ops = pulse.get_noisy_qobjevo(dims=self.dims)
+                qu, new_c_ops = pulse.get_noisy_qobjevo(
+                    dims=self.dims, args=args)
                 c_ops += new_c_ops
             else:
-                qu = pulse.get_ideal_qobjevo(dims=self.dims)
+                qu = pulse.get_ideal_qobjevo(dims=self.dims, args=args)
             qu_list.append(qu)
 
         final_qu = _merge_qobjevo(qu_list)
-        final_qu.args.update(args)
 
         # bring all c_ops to the same tlist, won't need it in QuTiP 5
         full_tlist = self.get_full_tlist()
-        temp = []
-        for c_op in c_ops:
-            temp.append(_merge_qobjevo([c_op], full_tlist))
-        c_ops = temp
+        # c_ops sharing a tlist reuse the same interpolation indices
+        fill_cache = {} if full_tlist is not None else None
+        c_ops = [_merge_qobjevo([c_op], full_tlist, fill_cache)
+                 for c_op in c_ops]
 
         if noisy:
             return final_qu, c_ops
         else:
             return final_qu, []
 
+    def _get_drift_hamiltonian(self):
+        """
+        Return the sum of the drift Hamiltonians, or 0 if there is none.
+        The result is kept until the drift is changed by `add_drift`.
+        """
+        if self._drift_cache is None:
+            H_drift = 0
+            for drift_ham in self.drift.drift_hamiltonians:
+                H_drift += drift_ham.get_qobj(self.dims)
+            self._drift_cache = H_drift
+        return self._drift_cache
+
     def run_analytically(self, init_state=None, qc=None):
         """
         Simulate the state evolution under the given `qutip.QubitCircuit`
@@ -613,22 +683,39 @@ class Processor(object):
         else:
             U_list = []
         tlist = self.get_full_tlist()
-        coeffs = self.get_full_coeffs()
+        coeffs = self.get_full_coeffs(tlist)
 
         # Compute drift Hamiltonians
-        H_drift = 0
-        for drift_ham in self.drift.drift_hamiltonians:
-            H_drift += drift_ham.get_qobj(self.dims)
+        H_drift = self._get_drift_hamiltonian()
 
         # Compute control Hamiltonians
-        for n in range(len(tlist)-1):
-            H = H_drift + sum(
-                [coeffs[m, n] * self.ctrls[m]
-                    for m in range(len(self.ctrls))])
-            dt = tlist[n + 1] - tlist[n]
-            U = (-1j * H * dt).expm()
-            U = self.eliminate_auxillary_modes(U)
-            U_list.append(U)
+        ctrls = self.ctrls
+        dts = np.diff(tlist)
+        # neighbouring time slots often share the same pulse amplitudes,
+        # only the first slot of each such run needs a propagator
+        new_slot = np.ones(len(dts), dtype=bool)
+        new_slot[1:] = (
+            (dts[1:] != dts[:-1])
+            | np.any(coeffs[:, 1:-1] != coeffs[:, :-2], axis=0))
+        slots = np.flatnonzero(new_slot)
+        # Hamiltonians of all these time slots, stacked along the first axis
+        basis = np.stack([ctrl.full() for ctrl in ctrls])
+        # pulses that are constant in time (or turned off) are summed once
+        const = np.all(coeffs[:, slots] == coeffs[:, :1], axis=1)
+        hams = np.tensordot(
+            coeffs[np.ix_(~const, slots)].T, basis[~const], axes=1)
+        hams += np.tensordot(coeffs[const, 0], basis[const], axes=1)
+        if isinstance(H_drift, Qobj):
+            hams += H_drift.full()
+        dims = ctrls[0].dims
+        # the propagators overwrite the Hamiltonians in place
+        props = [
+            self.eliminate_auxillary_modes(Qobj(U, dims=dims))
+            for U in _propagators(hams, dts[slots], out=hams)]
+        # repeated slots get copies, so that the propagators returned are
+        # independent objects
+        U_list += [props[ind] if new else props[ind].copy()
+                   for ind, new in zip(np.cumsum(new_slot) - 1, new_slot)]
 
         try:  # correct_global_phase are defined for ModelProcessor
             if self.correct_global_phase and self.global_phase != 0:
@@ -640,6 +727,63 @@ class Processor(object):
 
         return U_list
 
+    def run_state_analytically(self, init_state, sparse_threshold=0.1):
+        """
+        Compute the final state of the ideal evolution by applying the
+        exponential of the Hamiltonian of each time slot to the state,
+        without forming the propagators.
+        If the Hamiltonian of a time slot has a fraction of nonzero elements
+        below `sparse_threshold`, it is applied with
+        :func:`scipy.sparse.linalg.expm_multiply`, otherwise it is
+        exponentiated as a dense matrix.
+        This method won't include noise or collpase.
+
+        Parameters
+        ----------
+        init_state: :class:`qutip.Qobj`
+            The initial state (ket) in the full Hilbert space of
+            the processor, including the auxillary modes.
+
+        sparse_threshold: float, optional
+            The largest fraction of nonzero elements for which the
+            Hamiltonian is treated as sparse.
+
+        Returns
+        -------
+        final_state: :class:`qutip.Qobj`
+            The state at the end of the evolution.
+        """
+        if not init_state.isket:
+            raise ValueError("The initial state must be a ket.")
+        tlist = self.get_full_tlist()
+        coeffs = self.get_full_coeffs(tlist)
+        H_drift = self._get_drift_hamiltonian()
+        if isinstance(H_drift, Qobj):
+            H_drift = H_drift.data
+        ctrls = [ctrl.data for ctrl in self.ctrls]
+
+        state = init_state.full()
+        for n, dt in enumerate(np.diff(tlist)):
+            H = H_drift
+            for m, ctrl in enumerate(ctrls):
+                if coeffs[m, n] != 0:
+                    H = H + coeffs[m, n] * ctrl
+            if np.isscalar(H):
+                continue
+            if H.nnz < sparse_threshold * H.shape[0] * H.shape[1]:
+                state = expm_multiply(-1j * dt * H, state)
+            else:
+                state = expm(-1j * dt * H.toarray()) @ state
+        final_state = Qobj(state, dims=init_state.dims)
+
+        try:  # correct_global_phase are defined for ModelProcessor
+            if self.correct_global_phase and self.global_phase != 0:
+                final_state *= np.exp(1j * self.global_phase)
+        except AttributeError:
+            pass
+
+        return final_state
+
     def run(self, qc=None):
         """
         Calculate the propagator of the evolution by matrix exponentiation.
@@ -688,6 +832,10 @@ class Processor(object):
 
         **kwargs
             Keyword arguments for the qutip solver.
+            For long closed-system evolutions, passing
+            ``options=Options(normalize_output=False)`` avoids restarting
+            the ODE integrator to normalize the state at every time step,
+            at the cost of returning states that are not renormalized.
 
         Returns
         -------
@@ -829,9 +977,7 @@ class Processor(object):
 
         # make sure coeffs start and end with zero, for ax.fill
         tlist = np.hstack(([-dt*1.e-20], tlist, [tlist[-1] + dt*1.e-20]))
-        coeffs = []
-        for pulse in self.pulses:
-            coeffs.append(_pulse_interpolate(pulse, tlist))
+        coeffs = _pulses_interpolate(self.pulses, tlist)
 
         pulse_ind = 0
         axis = []
@@ -865,29 +1011,72 @@ class Processor(object):
         return fig, axis
 
 
-def _pulse_interpolate(pulse, tlist):
+def _propagators(hams, dts, out=None):
     """
-    A function that calls Scipy interpolation routine. Used for plotting.
+    Return the propagators ``exp(-1j * H * dt)`` for a stack of constant
+    Hamiltonians ``hams`` of shape ``(n, d, d)`` and time steps ``dts``.
+    Hermitian Hamiltonians are diagonalized together with one batched
+    ``eigh`` call, otherwise the matrix exponentials are computed by
+    ``scipy.linalg.expm``, on the whole stack when the version allows it.
+    The result is written into ``out`` if given, which may be ``hams``.
     """
-    if pulse.tlist is None and pulse.coeff is None:
-        coeff = np.zeros(len(tlist))
-        return coeff
-    if isinstance(pulse.coeff, bool):
-        if pulse.coeff:
-            coeff = np.ones(len(tlist))
+    if out is None:
+        out = np.empty(hams.shape, dtype=complex)
+    if not np.allclose(hams, hams.conj().transpose(0, 2, 1), rtol=0.,
+                       atol=settings.atol):
+        if _BATCHED_EXPM:
+            out[...] = expm(-1j * dts[:, np.newaxis, np.newaxis] * hams)
+        else:
+            for n, dt in enumerate(dts):
+                out[n] = expm(-1j * dt * hams[n])
+        return out
+    evals, evecs = np.linalg.eigh(hams)
+    evecs_dag = evecs.conj().transpose(0, 2, 1)
+    evecs *= np.exp(-1j * evals * dts[:, np.newaxis])[:, np.newaxis, :]
+    return np.matmul(evecs, evecs_dag, out=out)
+
+
+def _pulses_interpolate(pulses, tlist):
+    """
+    Interpolate the pulse coefficients at `tlist`, zero outside of the
+    `tlist` of each pulse. Pulses sharing the same `tlist` and spline kind
+    are interpolated together. Used for plotting.
+    """
+    coeffs = np.zeros((len(pulses), len(tlist)))
+    groups = {}
+    for i, pulse in enumerate(pulses):
+        if pulse.tlist is None and pulse.coeff is None:
+            continue
+        if isinstance(pulse.coeff, bool):
+            if pulse.coeff:
+                coeffs[i] = 1.
+            continue
+        key = (id(pulse.tlist), pulse.spline_kind, len(pulse.coeff))
+        groups.setdefault(key, []).append(i)
+
+    for inds in groups.values():
+        pulse = pulses[inds[0]]
+        pulse_tlist = np.asarray(pulse.tlist)
+        coeff = np.array([pulses[i].coeff for i in inds])
+        discrete = coeff.shape[1] == len(pulse_tlist)-1
+        if pulse.spline_kind == "step_func":
+            # value at the nearest time on the left,
+            # a discrete pulse is zero from its last time on
+            if discrete:
+                inside = tlist < pulse_tlist[-1]
+            else:
+                inside = tlist <= pulse_tlist[-1]
+            inside &= tlist >= pulse_tlist[0]
+            inds_left = np.searchsorted(
+                pulse_tlist, tlist[inside], side="right") - 1
+            coeffs[np.ix_(inds, inside)] = coeff[:, inds_left]
         else:
-            coeff = np.zeros(len(tlist))
-        return coeff
-    coeff = pulse.coeff
-    if len(coeff) == len(pulse.tlist)-1:  # for discrete pulse
-        coeff = np.concatenate([coeff, [0]])
-
-    from scipy import interpolate
-    if pulse.spline_kind == "step_func":
-        kind = "previous"
-    else:
-        kind = "cubic"
-    inter = interpolate.interp1d(
-        pulse.tlist, coeff, kind=kind,
-        bounds_error=False, fill_value=0.0)
-    return inter(tlist)
+            if discrete:
+                padded = np.zeros(
+                    (len(inds), len(pulse_tlist)), dtype=coeff.dtype)
+                padded[:, :-1] = coeff
+                coeff = padded
+            spline = CubicSpline(
+                pulse_tlist, coeff, axis=1, extrapolate=False)
+            coeffs[inds] = np.nan_to_num(spline(tlist), nan=0.)
+    return coeffs
@@ -1,6 +1,6 @@
 import numbers
 from collections.abc import Iterable
-from copy import deepcopy
+from copy import copy
 import numpy as np
 
 from qutip.qobjevo import QobjEvo
@@ -45,7 +45,7 @@ def process_noise(pulses, noise_list, dims, t1=None, t2=None,
     noisy_pulses: list of :class:`qutip.qip.Pulse`
         The noisy pulses, including the system noise.
     """
-    noisy_pulses = deepcopy(pulses)
+    noisy_pulses = [copy(pulse) for pulse in pulses]
     systematic_noise = Pulse(None, None, label="systematic_noise")
 
     if (t1 is not None) or (t2 is not None):
@@ -1,3 +1,5 @@
+from copy import copy
+
 import numpy as np
 from scipy.interpolate import CubicSpline
 
@@ -53,37 +55,40 @@ class _EvoElement():
             targets = self.targets
         return expand_operator(qobj, len(dims), targets, dims)
 
-    def _get_qobjevo_helper(self, spline_kind, dims):
+    def _get_qobjevo_helper(self, spline_kind, dims, args=None):
         """
         Please refer to `_Evoelement.get_qobjevo` for documentation.
         """
         mat = self.get_qobj(dims)
+        if args is None:
+            args = {}
         if self.tlist is None and self.coeff is None:
-            qu = QobjEvo(mat) * 0.
+            qu = QobjEvo(mat, args=args) * 0.
         elif isinstance(self.coeff, bool):
             if self.coeff:
                 if self.tlist is None:
-                    qu = QobjEvo(mat, tlist=self.tlist)
+                    qu = QobjEvo(mat, tlist=self.tlist, args=args)
                 else:
                     qu = QobjEvo([mat, np.ones(len(self.tlist))],
-                                 tlist=self.tlist)
+                                 tlist=self.tlist, args=args)
             else:
-                qu = QobjEvo(mat * 0., tlist=self.tlist)
+                qu = QobjEvo(mat * 0., tlist=self.tlist, args=args)
         else:
             if spline_kind == "step_func":
-                args = {"_step_func_coeff": True}
+                spline_args = {"_step_func_coeff": True}
                 if len(self.coeff) == len(self.tlist) - 1:
                     self.coeff = np.concatenate([self.coeff, [0.]])
             elif spline_kind == "cubic":
-                args = {"_step_func_coeff": False}
+                spline_args = {"_step_func_coeff": False}
             else:
                 # The spline will follow other pulses or
                 # use the default value of QobjEvo
-                args = {}
-            qu = QobjEvo([mat, self.coeff], tlist=self.tlist, args=args)
+                spline_args = {}
+            qu = QobjEvo([mat, self.coeff], tlist=self.tlist,
+                         args={**spline_args, **args})
         return qu
 
-    def get_qobjevo(self, spline_kind, dims):
+    def get_qobjevo(self, spline_kind, dims, args=None):
         """
         Get the `QobjEvo` representation of the evolution element.
         If both `tlist` and `coeff` are None, treated as zero matrix.
@@ -109,6 +114,8 @@ class _EvoElement():
             Dimension of the system.
             If int, we assume it is the number of qubits in the system.
             If list, it is the dimension of the component systems.
+        args: dict, optional
+            Arguments for :class:`qutip.QobjEvo`.
 
         Returns
         -------
@@ -116,7 +123,7 @@ class _EvoElement():
             The `QobjEvo` representation of the evolution element.
         """
         try:
-            return self._get_qobjevo_helper(spline_kind, dims=dims)
+            return self._get_qobjevo_helper(spline_kind, dims=dims, args=args)
         except Exception as err:
             print(
                 "The Evolution element went wrong was\n {}".format(str(self)))
@@ -350,7 +357,7 @@ class Pulse():
         """
         return self.ideal_pulse.get_qobj(dims)
 
-    def get_ideal_qobjevo(self, dims):
+    def get_ideal_qobjevo(self, dims, args=None):
         """
         Get a `QobjEvo` representation of the ideal evolution.
 
@@ -360,15 +367,17 @@ class Pulse():
             Dimension of the system.
             If int, we assume it is the number of qubits in the system.
             If list, it is the dimension of the component systems.
+        args: dict, optional
+            Arguments for :class:`qutip.QobjEvo`.
 
         Returns
         -------
         ideal_evo: :class:`qutip.QobjEvo`
             A `QobjEvo` representing the ideal evolution.
         """
-        return self.ideal_pulse.get_qobjevo(self.spline_kind, dims)
+        return self.ideal_pulse.get_qobjevo(self.spline_kind, dims, args=args)
 
-    def get_noisy_qobjevo(self, dims):
+    def get_noisy_qobjevo(self, dims, args=None):
         """
         Get the :obj:`.QobjEvo` representation of the noisy evolution. The
         result can be used directly as input for the qutip solvers.
@@ -379,6 +388,8 @@ class Pulse():
             Dimension of the system.
             If int, we assume it is the number of qubits in the system.
             If list, it is the dimension of the component systems.
+        args: dict, optional
+            Arguments for :class:`qutip.QobjEvo` of the Hamiltonian.
 
         Returns
         -------
@@ -387,8 +398,8 @@ class Pulse():
         c_ops: list of :class:`qutip.QobjEvo`
             A list of (time-dependent) lindbald operators.
         """
-        ideal_qu = self.get_ideal_qobjevo(dims)
-        noise_qu_list = [noise.get_qobjevo(self.spline_kind, dims)
+        ideal_qu = self.get_ideal_qobjevo(dims, args=args)
+        noise_qu_list = [noise.get_qobjevo(self.spline_kind, dims, args=args)
                          for noise in self.coherent_noise]
         qu = _merge_qobjevo([ideal_qu] + noise_qu_list)
         c_ops = [noise.get_qobjevo(self.spline_kind, dims)
@@ -425,6 +436,19 @@ class Pulse():
             (full_tlist[:1], full_tlist[1:][np.diff(full_tlist) > tol]))
         return full_tlist
 
+    def __copy__(self):
+        """
+        Copy the pulse and its evolution elements, so that noise can be
+        added to the copy. The operators and coefficients are shared, they
+        are replaced rather than modified in place.
+        """
+        new = object.__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        new.ideal_pulse = copy(self.ideal_pulse)
+        new.coherent_noise = [copy(ele) for ele in self.coherent_noise]
+        new.lindblad_noise = [copy(ele) for ele in self.lindblad_noise]
+        return new
+
     def print_info(self):
         """
         Print the information of the pulse, including the ideal dynamics,
@@ -491,7 +515,7 @@ class Drift():
         """
         self.drift_hamiltonians.append(_EvoElement(qobj, targets))
 
-    def get_ideal_qobjevo(self, dims):
+    def get_ideal_qobjevo(self, dims, args=None):
         """
         Get the QobjEvo representation of the drift Hamiltonian.
 
@@ -501,6 +525,8 @@ class Drift():
             Dimension of the system.
             If int, we assume it is the number of qubits in the system.
             If list, it is the dimension of the component systems.
+        args: dict, optional
+            Arguments for :class:`qutip.QobjEvo`.
 
         Returns
         -------
@@ -509,10 +535,13 @@ class Drift():
         """
         if not self.drift_hamiltonians:
             self.drift_hamiltonians = [_EvoElement(None, None)]
-        qu_list = [QobjEvo(evo.get_qobj(dims)) for evo in self.drift_hamiltonians]
+        if args is None:
+            args = {}
+        qu_list = [QobjEvo(evo.get_qobj(dims), args=args)
+                   for evo in self.drift_hamiltonians]
         return _merge_qobjevo(qu_list)
 
-    def get_noisy_qobjevo(self, dims):
+    def get_noisy_qobjevo(self, dims, args=None):
         """
         Same as the `get_ideal_qobjevo` method. There is no additional noise
         for the drift evolution.
@@ -524,7 +553,7 @@ class Drift():
         c_ops: list of :class:`qutip.QobjEvo`
             Always an empty list for Drift
         """
-        return self.get_ideal_qobjevo(dims), []
+        return self.get_ideal_qobjevo(dims, args=args), []
 
 
 def _find_common_tlist(qobjevo_list, tol=1.0e-10):
@@ -545,10 +574,12 @@ def _find_common_tlist(qobjevo_list, tol=1.0e-10):
 ########################################################################
 
 
-def _merge_qobjevo(qobjevo_list, full_tlist=None):
+def _merge_qobjevo(qobjevo_list, full_tlist=None, fill_cache=None):
     """
     Combine a list of `:class:qutip.QobjEvo` into one,
     different tlist will be merged.
+    ``fill_cache`` can be shared between calls with the same ``full_tlist``,
+    see :func:`_fill_coeff`.
     """
     # TODO This method can be eventually integrated into QobjEvo, for
     # which a more thorough test is required
@@ -560,16 +591,18 @@ def _merge_qobjevo(qobjevo_list, full_tlist=None):
     if full_tlist is None:
         full_tlist = _find_common_tlist(qobjevo_list)
     spline_types_num = set()
-    args = {}
+    coeff_args = {}
     for qu in qobjevo_list:
         if isinstance(qu, QobjEvo):
             try:
                 spline_types_num.add(qu.args["_step_func_coeff"])
             except Exception:
                 pass
-            args.update(qu.args)
+            coeff_args.update(qu.args)
     if len(spline_types_num) > 1:
         raise ValueError("Cannot merge Qobjevo with different spline kinds.")
+    if fill_cache is None:
+        fill_cache = {}
 
     for i, qobjevo in enumerate(qobjevo_list):
         if isinstance(qobjevo, Qobj):
@@ -578,42 +611,58 @@ def _merge_qobjevo(qobjevo_list, full_tlist=None):
         for j, ele in enumerate(qobjevo.ops):
             if isinstance(ele.coeff, np.ndarray):
                 new_coeff = _fill_coeff(
-                    ele.coeff, qobjevo.tlist, full_tlist, args)
+                    ele.coeff, qobjevo.tlist, full_tlist, coeff_args,
+                    fill_cache=fill_cache)
                 qobjevo_list[i].ops[j].coeff = new_coeff
         qobjevo_list[i].tlist = full_tlist
 
-    qobjevo = sum(qobjevo_list)
+    # Accumulate in place: each addition then only copies the added terms,
+    # where sum would copy the growing partial sum at every step.
+    qobjevo = qobjevo_list[0].copy()
+    for other in qobjevo_list[1:]:
+        qobjevo += other
     return qobjevo
 
 
-def _fill_coeff(old_coeffs, old_tlist, full_tlist, args=None, tol=1.0e-10):
+def _fill_coeff(old_coeffs, old_tlist, full_tlist, args=None, tol=1.0e-10,
+                fill_cache=None):
     """
     Make a step function coefficients compatible with a longer `tlist` by
     filling the empty slot with the nearest left value.
 
     The returned `coeff` always have the same size as the `tlist`.
     If `step_func`, the last element is 0.
+
+    For step functions, the indices found for ``old_tlist`` are stored in
+    the dict ``fill_cache`` if given, and reused for coefficients sharing
+    the same ``old_tlist`` object. It must only be shared between calls
+    with the same ``full_tlist``.
     """
     if args is None:
         args = {}
     if "_step_func_coeff" in args and args["_step_func_coeff"]:
-        if len(old_coeffs) == len(old_tlist) - 1:
-            old_coeffs = np.concatenate([old_coeffs, [0]])
-        new_n = len(full_tlist)
-        old_ind = 0  # index for old coeffs and tlist
-        new_coeff = np.zeros(new_n)
-        for new_ind in range(new_n):
-            t = full_tlist[new_ind]
-            if old_tlist[0] - t > tol:
-                new_coeff[new_ind] = 0.
-                continue
-            if t - old_tlist[-1] > tol:
-                new_coeff[new_ind] = 0.
-                continue
+        old_coeffs = np.asarray(old_coeffs)
+        full_tlist = np.asarray(full_tlist)
+        if fill_cache is not None and id(old_tlist) in fill_cache:
+            _, inside, old_inds = fill_cache[id(old_tlist)]
+        else:
+            tlist = np.asarray(old_tlist)
+            # the coefficient is zero outside of old_tlist
+            inside = ((tlist[0] - full_tlist <= tol)
+                      & (full_tlist - tlist[-1] <= tol))
+            # index of the nearest time on the left,
             # tol is required because of the floating-point error
-            if old_tlist[old_ind+1] <= t + tol:
-                old_ind += 1
-            new_coeff[new_ind] = old_coeffs[old_ind]
+            old_inds = np.searchsorted(
+                tlist, full_tlist[inside] + tol, side="right") - 1
+            if fill_cache is not None:
+                # old_tlist is kept so that its id is not reused
+                fill_cache[id(old_tlist)] = (old_tlist, inside, old_inds)
+        new_coeff = np.zeros(len(full_tlist),
+                             dtype=np.result_type(old_coeffs, float))
+        new_coeff[inside] = old_coeffs.take(old_inds, mode="clip")
+        if len(old_coeffs) < len(old_tlist):
+            # a discrete coefficient is zero from the last time of old_tlist
+            new_coeff[inside] *= old_inds < len(old_coeffs)
     else:
         sp = CubicSpline(old_tlist, old_coeffs)
         new_coeff = sp(full_tlist)
@@ -23,6 +23,7 @@ from numpy import (arccos, arccosh, arcsin, arcsinh, arctan, arctan2, arctanh,
 
 import numpy as np
 import scipy.sparse as sp
+from scipy.sparse.linalg import ArpackNoConvergence
 import qutip.settings as settings
 from qutip import __version__
 from qutip.fastsparse import fast_csr_matrix, fast_identity
@@ -1890,12 +1891,35 @@ class Qobj(object):
         """
         return mts.dnorm(self, B)
 
+    def _map_property(self, name, compute):
+        """
+        Return the property ``name`` of the map represented by this object,
+        calling ``compute`` only if it was not computed yet for the current
+        data, dims and superrep.
+        """
+        key = (self.superrep, repr(self.dims))
+        cache = self.__dict__.get('_map_cache')
+        if cache is None or cache[0] is not self.data or cache[1] != key:
+            cache = (self.data, key, {})
+            self._map_cache = cache
+        if name not in cache[2]:
+            cache[2][name] = compute()
+        return cache[2][name]
+
+    def _choi(self):
+        """
+        The Choi matrix of this map, shared by the ishp, iscp and istp checks.
+        """
+        return self._map_property('choi', lambda: sr.to_choi(self))
+
     @property
     def ishp(self):
-        # FIXME: this needs to be cached in the same ways as isherm.
+        return self._map_property('hp', self._ishp)
+
+    def _ishp(self):
         if self.type in ["super", "oper"]:
             try:
-                J = sr.to_choi(self)
+                J = self._choi()
                 return J.isherm
             except TypeError:
                 return False
@@ -1904,7 +1928,9 @@ class Qobj(object):
 
     @property
     def iscp(self):
-        # FIXME: this needs to be cached in the same ways as isherm.
+        return self._map_property('cp', self._iscp)
+
+    def _iscp(self):
         if self.type in ["super", "oper"]:
             try:
                 J = (
@@ -1913,7 +1939,7 @@ class Qobj(object):
                     # transformation between them is unitary and hence
                     # preserves the CP and TP conditions.
                     if self.superrep in ('choi', 'chi')
-                    else sr.to_choi(self)
+                    else self._choi()
                 )
                 # If J isn't hermitian, then that could indicate either
                 # that J is not normal, or is normal,
@@ -1922,6 +1948,15 @@ class Qobj(object):
                 # eigenvalues be non-negative.
                 if not J.isherm:
                     return False
+                # Only the sign of the lowest eigenvalue matters. For large
+                # Choi matrices, ARPACK finds it without the full spectrum.
+                if J.shape[0] >= 32:
+                    try:
+                        eigs = J.eigenenergies(
+                            sparse=True, sort='low', eigvals=1)
+                        return all(eigs >= -settings.atol)
+                    except ArpackNoConvergence:
+                        pass
                 eigs = J.eigenenergies()
                 return all(eigs >= -settings.atol)
             except TypeError:
@@ -1931,7 +1966,9 @@ class Qobj(object):
 
     @property
     def istp(self):
-        import qutip.superop_reps as sr
+        return self._map_property('tp', self._istp)
+
+    def _istp(self):
         if self.type in ["super", "oper"]:
             try:
                 # Normalize to a super of type choi or chi.
@@ -1941,7 +1978,7 @@ class Qobj(object):
                 if self.type == "super" and self.superrep in ('choi', 'chi'):
                     qobj = self
                 else:
-                    qobj = sr.to_choi(self)
+                    qobj = self._choi()
 
                 # Possibly collapse dims.
                 if any(
@@ -1964,11 +2001,9 @@ class Qobj(object):
 
     @property
     def iscptp(self):
-        from qutip.superop_reps import to_choi
         if self.type == "super" or self.type == "oper":
-            reps = ('choi', 'chi')
-            q_oper = to_choi(self) if self.superrep not in reps else self
-            return q_oper.iscp and q_oper.istp
+            # Both checks go through the same cached Choi matrix.
+            return self.iscp and self.istp
         else:
             return False
 
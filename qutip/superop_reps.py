@@ -13,24 +13,24 @@ __all__ = ['super_to_choi', 'choi_to_super', 'choi_to_kraus', 'kraus_to_choi',
            ]
 
 # Python Standard Library
+from functools import lru_cache
 from itertools import starmap, product
 
 # NumPy/SciPy
 from numpy.core.multiarray import array, zeros
-from numpy.core.shape_base import hstack
 from numpy.matrixlib.defmatrix import matrix
 from numpy import sqrt, floor, log2
 from numpy import dot
-from scipy.linalg import eig, svd
+from scipy.linalg import eig, eigh, svd
+import scipy.sparse as sp
 # Needed to avoid conflict with itertools.product.
 import numpy as np
 
 # Other QuTiP functions and classes
-from qutip.superoperator import vec2mat, operator_to_vector, sprepost
+from qutip.superoperator import operator_to_vector, sprepost
 from qutip.operators import identity, sigmax, sigmay, sigmaz
 from qutip.tensor import tensor, flatten
 from qutip.qobj import Qobj
-from qutip.states import basis
 
 
 # SPECIFIC SUPEROPERATORS -----------------------------------------------------
@@ -74,19 +74,30 @@ def _dep_choi(pe):
 _SINGLE_QUBIT_PAULI_BASIS = (identity(2), sigmax(), sigmay(), sigmaz())
 
 
-def _pauli_basis(nq=1):
+@lru_cache(maxsize=8)
+def _pauli_basis_matrix(nq):
+    """
+    Returns the change of basis matrix of `_pauli_basis` as a read-only
+    array. It is computed once for each number of qubits, since callers
+    only ever read it.
+    """
     # NOTE: This is slow as can be.
     # TODO: Make this sparse. CSR format was causing problems for the [idx, :]
     #       slicing below.
     B = zeros((4 ** nq, 4 ** nq), dtype=complex)
-    dims = [[[2] * nq] * 2] * 2
 
     for idx, op in enumerate(starmap(tensor,
                                      product(_SINGLE_QUBIT_PAULI_BASIS,
                                              repeat=nq))):
         B[:, idx] = operator_to_vector(op).dag().full()
 
-    return Qobj(B, dims=dims)
+    B.flags.writeable = False
+    return B
+
+
+def _pauli_basis(nq=1):
+    dims = [[[2] * nq] * 2] * 2
+    return Qobj(_pauli_basis_matrix(nq), dims=dims)
 
 
 # PRIVATE CONVERSION FUNCTIONS ------------------------------------------------
@@ -105,16 +116,31 @@ def _super_tofrom_choi(q_oper):
     private; only those functions which wrap this in a way so as to preserve
     type should be called externally.
     """
-    data = q_oper.data.toarray()
     dims = q_oper.dims
     new_dims = [[dims[1][1], dims[0][1]], [dims[1][0], dims[0][0]]]
     d0 = np.prod(np.ravel(new_dims[0]))
     d1 = np.prod(np.ravel(new_dims[1]))
     s0 = np.prod(dims[0][0])
     s1 = np.prod(dims[1][1])
+    # The reshuffle is the transpose (3, 1, 2, 0) of the data reshaped to
+    # [s0, s1, s0, s1]. The two middle axes keep their order, so they are
+    # merged into one, which lets NumPy copy longer contiguous runs.
+    if q_oper.data.nnz >= 0.1 * np.prod(q_oper.shape):
+        data = q_oper.data.toarray()
+        return Qobj(dims=new_dims,
+                    inpt=data.reshape([s0, s1 * s0, s1]).
+                    transpose(2, 1, 0).reshape((d0, d1)))
+    # For sparse maps, move the nonzero elements directly to their new
+    # positions instead of reshuffling a dense copy.
+    data = q_oper.data.tocoo()
+    flat_idx = data.row.astype(np.int64) * q_oper.shape[1] + data.col
+    idx = np.unravel_index(flat_idx, (s0, s1 * s0, s1))
+    new_flat_idx = np.ravel_multi_index(
+        (idx[2], idx[1], idx[0]), (s1, s1 * s0, s0))
     return Qobj(dims=new_dims,
-                inpt=data.reshape([s0, s1, s0, s1]).
-                transpose(3, 1, 2, 0).reshape((d0, d1)))
+                inpt=sp.csr_matrix(
+                    (data.data, (new_flat_idx // d1, new_flat_idx % d1)),
+                    shape=(d0, d1)))
 
 
 def _isqubitdims(dims):
@@ -190,12 +216,27 @@ def choi_to_kraus(q_oper, tol=1e-9):
     TODO: Create a new class structure for quantum channels, perhaps as a
     strict sub-class of Qobj.
     """
-    vals, vecs = eig(q_oper.full())
-    vecs = [array(_) for _ in zip(*vecs)]
+    if q_oper.isherm:
+        # Choi matrices of Hermiticity-preserving maps are Hermitian, so the
+        # faster Hermitian solver applies. Its real eigenvalues are made
+        # complex so that negative ones still have a square root, and are
+        # sorted with the dominant Kraus operators first.
+        vals, vecs = eigh(q_oper.full())
+        vals = vals[::-1].astype(complex)
+        vecs = vecs[:, ::-1]
+        # Fix the arbitrary phase of each eigenvector by making its largest
+        # entry real and positive.
+        largest = vecs[np.argmax(abs(vecs), axis=0), np.arange(len(vals))]
+        vecs = vecs * (abs(largest) / largest)
+    else:
+        vals, vecs = eig(q_oper.full())
+    keep = abs(vals) >= tol
     shape = [np.prod(q_oper.dims[0][i]) for i in range(2)][::-1]
-    return [Qobj(inpt=sqrt(val)*vec2mat(vec, shape=shape),
-            dims=q_oper.dims[0][::-1])
-            for val, vec in zip(vals, vecs) if abs(val) >= tol]
+    # Unstack the kept eigenvectors column-wise (as vec2mat does) into a
+    # single (r, d_out, d_in) array of Kraus operators.
+    kraus = (sqrt(vals[keep]) * vecs[:, keep]).reshape(
+        shape[1], shape[0], -1).transpose(2, 1, 0)
+    return [Qobj(inpt=K, dims=q_oper.dims[0][::-1]) for K in kraus]
 
 
 def kraus_to_choi(kraus_list):
@@ -203,15 +244,11 @@ def kraus_to_choi(kraus_list):
     Takes a list of Kraus operators and returns the Choi matrix for the channel
     represented by the Kraus operators in `kraus_list`
     """
-    kraus_mat_list = list(map(lambda x: x.data.toarray(), kraus_list))
-    op_rng = range(kraus_mat_list[0].shape[0])
-    choi_blocks = array([[sum([
-                              np.outer(op[:, c_ix],
-                                       np.transpose(np.conjugate(op))[r_ix, :])
-                              for op in kraus_mat_list])
-                          for r_ix in op_rng]
-                         for c_ix in op_rng])
-    return Qobj(inpt=hstack(hstack(choi_blocks)),
+    # The Choi matrix is sum_k vec(K_k) vec(K_k)^dag, computed as a single
+    # product of the column-stacked Kraus operators.
+    vecs = np.stack([op.full().ravel(order='F') for op in kraus_list],
+                    axis=1)
+    return Qobj(inpt=vecs @ vecs.conj().T,
                 dims=[kraus_list[0].dims[::-1], kraus_list[0].dims[::-1]],
                 type='super', superrep='choi')
 
@@ -239,13 +276,12 @@ def choi_to_chi(q_oper):
     Heisenberg-Weyl for other subsystem dimensions.
     """
     nq = _nq(q_oper.dims)
-    B = _pauli_basis(nq)
-    # Force the basis change to match the dimensions of
-    # the input.
-    B.dims = q_oper.dims
-    B.superrep = 'choi'
+    # The change of basis matrix is cached, so we apply it directly rather
+    # than wrapping it in a Qobj whose dims must then be forced to match.
+    B = _pauli_basis_matrix(nq)
+    chi = B.conj().T @ q_oper.full() @ B
 
-    return Qobj(B.dag() * q_oper * B, superrep='chi')
+    return Qobj(chi, dims=q_oper.dims, superrep='chi')
 
 
 def chi_to_choi(q_oper):
@@ -256,20 +292,12 @@ def chi_to_choi(q_oper):
     Heisenberg-Weyl for other subsystem dimensions.
     """
     nq = _nq(q_oper.dims)
-    B = _pauli_basis(nq)
-    # Force the basis change to match the dimensions of
-    # the input.
-    B.dims = q_oper.dims
-
-    # We normally should not multiply objects of different
-    # superreps, so Qobj warns about that. Here, however, we're actively
-    # converting between, so the superrep of B is irrelevant.
-    # To suppress warnings, we pretend that B is also a chi.
-    B.superrep = 'chi'
+    B = _pauli_basis_matrix(nq)
+    choi = B @ q_oper.full() @ B.conj().T
 
     # The Chi matrix has tr(chi) == d², so we need to divide out
     # by that to get back to the Choi form.
-    return Qobj((B * q_oper * B.dag()) / q_oper.shape[0], superrep='choi')
+    return Qobj(choi / q_oper.shape[0], dims=q_oper.dims, superrep='choi')
 
 def _svd_u_to_kraus(U, S, d, dK, indims, outdims):
     """
@@ -340,16 +368,13 @@ def choi_to_stinespring(q_oper, thresh=1e-10):
     out_left, out_right = out_dims
     in_left, in_right = in_dims
 
-    A = Qobj(zeros((dK * dL, dL)), dims=[out_left + [dK], out_right + [1]])
-    B = Qobj(zeros((dK * dR, dR)), dims=[in_left + [dK], in_right + [1]])
-
-    for idx_kraus, (KL, KR) in enumerate(zip(kU, kV)):
-        A += tensor(KL, basis(dK, idx_kraus))
-        B += tensor(KR, basis(dK, idx_kraus))
-        
-    # There is no input (right) Kraus index, so strip that off.
-    del A.dims[1][-1]
-    del B.dims[1][-1]
+    # Stacking the Kraus operators along a new last output index gives
+    # sum_k tensor(K_k, basis(dK, k)) without building each term.
+    # There is no input (right) Kraus index.
+    A = Qobj(np.stack([K.full() for K in kU], axis=1).reshape(dK * dL, dL),
+             dims=[out_left + [dK], out_right])
+    B = Qobj(np.stack([K.full() for K in kV], axis=1).reshape(dK * dR, dR),
+             dims=[in_left + [dK], in_right])
 
     return A, B
 
@@ -392,7 +417,9 @@ def to_choi(q_oper):
         else:
             raise TypeError(q_oper.superrep)
     elif q_oper.type == 'oper':
-        return super_to_choi(sprepost(q_oper, q_oper.dag()))
+        # Conjugation by q_oper has q_oper as its only Kraus operator, so the
+        # supermatrix does not need to be built and reshuffled.
+        return kraus_to_choi([q_oper])
     else:
         raise TypeError(
             "Conversion of Qobj with type = {0.type} "
@@ -437,7 +464,7 @@ def to_chi(q_oper):
         else:
             raise TypeError(q_oper.superrep)
     elif q_oper.type == 'oper':
-        return to_chi(sprepost(q_oper, q_oper.dag()))
+        return choi_to_chi(kraus_to_choi([q_oper]))
     else:
         raise TypeError(
             "Conversion of Qobj with type = {0.type} "
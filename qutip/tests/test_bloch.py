@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+
+plt = pytest.importorskip("matplotlib.pyplot")
+from matplotlib.collections import PathCollection
+
+import qutip.bloch
+from qutip import Bloch
+
+
+def _num_scattered(b):
+    return sum(len(collection.get_offsets())
+               for collection in b.axes.collections
+               if isinstance(collection, PathCollection))
+
+
+def _num_arrows(b):
+    return sum(len(artist._colors) for artist in b.axes.get_children()
+               if isinstance(artist, qutip.bloch.Arrow3DBatch))
+
+
+def test_points_list_mutation():
+    b = Bloch()
+    b.add_points(np.array([[1, 0], [0, 1], [0, 0]]))
+    b.points.append(np.array([[0], [0], [1]]))
+    b.point_style.append('s')
+    assert len(b.points) == 2
+    b.render()
+    assert _num_scattered(b) == 3
+
+    b.points[1] = np.array([[0, 0, 0], [0, 0, 0], [1, -1, 0.5]])
+    b.render()
+    assert _num_scattered(b) == 5
+
+    del b.points[0]
+    del b.point_style[0]
+    b.render()
+    assert _num_scattered(b) == 3
+    plt.close(b.fig)
+
+
+def test_vectors_list_mutation():
+    b = Bloch()
+    b.add_vectors([[1, 0, 0], [0, 1, 0]])
+    b.vectors.append([0, 0, 1])
+    assert len(b.vectors) == 3
+    b.render()
+    assert _num_arrows(b) == 3
+
+    b.vectors.pop()
+    b.render()
+    assert _num_arrows(b) == 2
+
+    b.vectors = [[0, 0, -1]]
+    b.render()
+    assert _num_arrows(b) == 1
+    plt.close(b.fig)
+
+
+def test_projection_on_z_axis(tmp_path):
+    b = Bloch()
+    b.add_projection(0, 0, 0.8, z_label='z')
+    b.add_projection(0.5, 0.5, 0.5, x_label='x', y_label='y', z_label='z',
+                     xy=True)
+    b.save(str(tmp_path / "bloch.png"))
+    assert (tmp_path / "bloch.png").exists()
+
+
+def _count_renders(monkeypatch):
+    renders = []
+    render = Bloch.render
+
+    def counted_render(self, *args, **kwargs):
+        renders.append(args)
+        return render(self, *args, **kwargs)
+    monkeypatch.setattr(Bloch, "render", counted_render)
+    return renders
+
+
+def test_show_renders_after_in_place_changes(monkeypatch):
+    b = Bloch()
+    b.add_vectors([[1, 0, 0], [0, 1, 0]])
+    b.add_points([[0.5], [0.5], [0]])
+    b.add_projection(0.5, 0.5, 0.5, x_label='x', y_label='y', z_label='z',
+                     xy=True)
+    b.show()
+    # Rendering must not add the projection labels to the data sets.
+    assert b.annotations == []
+    renders = _count_renders(monkeypatch)
+    b.show()
+    assert len(renders) == 0
+
+    b.vectors[0] = [0, 0, 1]
+    b.show()
+    assert len(renders) == 1
+    b.vectors[1][:] = [0, 0, -1]
+    b.show()
+    assert len(renders) == 2
+    b.points[0][2, 0] = 0.5
+    b.show()
+    assert len(renders) == 3
+    b.show()
+    assert len(renders) == 3
+    plt.close(b.fig)
+
+
+def test_repr_png_after_in_place_changes(monkeypatch):
+    pytest.importorskip("IPython")
+    b = Bloch()
+    b.add_vectors([[1, 0, 0]])
+    b.add_projection(0.5, 0.5, 0.5, z_label='z')
+    renders = _count_renders(monkeypatch)
+    first = b._repr_png_()
+    assert b._repr_png_() is first
+    assert len(renders) == 1
+
+    b.vectors[0][:] = [0, 1, 0]
+    second = b._repr_png_()
+    assert len(renders) == 2
+    assert second != first
+    assert b._repr_png_() is second
+    assert len(renders) == 2
+
+
+def test_make_sphere_after_clearing_axes():
+    fig = plt.figure()
+    ax = fig.add_subplot(projection='3d')
+    b = Bloch(fig=fig, axes=ax)
+    b.add_vectors([1, 0, 0])
+    b.make_sphere()
+    num_collections = len(ax.collections)
+    num_texts = len(ax.texts)
+    assert num_collections > 0
+
+    # Typical of animations: the axes are cleared before each frame.
+    ax.clear()
+    b.make_sphere()
+    assert len(ax.collections) == num_collections
+    assert len(ax.texts) == num_texts
+    assert _num_arrows(b) == 1
+    plt.close(fig)
+
+
+def test_show_after_save(tmp_path, monkeypatch):
+    b = Bloch()
+    b.add_vectors([1, 0, 0])
+    b.save(str(tmp_path / "bloch.png"))
+    closed = b.fig
+    assert not plt.fignum_exists(closed.number)
+    renders = _count_renders(monkeypatch)
+    b.show()
+    assert len(renders) == 1
+    assert b.fig is not closed
+    assert plt.fignum_exists(b.fig.number)
+    assert _num_arrows(b) == 1
+    plt.close(b.fig)
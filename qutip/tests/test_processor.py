@@ -38,6 +38,11 @@ class TestCircuitProcessor:
         assert_allclose(tensor([identity(2), sigmay()]), proc.ctrls[0])
         proc.remove_pulse(0)
         assert_allclose(len(proc.ctrls), 0)
+        proc.add_control(sigmax(), cyclic_permutation=True, label="sx")
+        proc.add_control(sigmaz(), label="sz")
+        proc.remove_pulse(label="sx")
+        assert_allclose(len(proc.ctrls), 1)
+        assert_allclose(tensor([sigmaz(), identity(2)]), proc.ctrls[0])
 
     def test_save_read(self):
         """
@@ -69,6 +74,14 @@ class TestCircuitProcessor:
         os.remove("qutip_test_CircuitProcessor.txt")
         assert_allclose(proc2.get_full_coeffs(), proc.get_full_coeffs())
 
+        proc3 = Processor(N=2)
+        proc3.add_control(sigmaz(), cyclic_permutation=True)
+        proc.save_coeff("qutip_test_CircuitProcessor.npy", binary=True)
+        proc3.read_coeff("qutip_test_CircuitProcessor.npy", binary=True)
+        os.remove("qutip_test_CircuitProcessor.npy")
+        assert_allclose(proc3.get_full_coeffs(), proc.get_full_coeffs())
+        assert_allclose(proc3.get_full_tlist(), proc.get_full_tlist())
+
     def test_id_evolution(self):
         """
         Test for identity evolution
@@ -306,6 +319,49 @@ class TestCircuitProcessor:
         fid = fidelity(sigmax() * init_state, analytical_result)
         assert((1 - fid) < 1.0e-6)
 
+    def testRunAnalyticallyRepeatedSlots(self):
+        """
+        Test that time slots with the same pulses give independent
+        propagators
+        """
+        processor = Processor(N=1)
+        processor.add_control(sigmax(), targets=0)
+        processor.pulses[0].tlist = np.linspace(0., 3., 4)
+        processor.pulses[0].coeff = np.array([1., 1., 1.])
+        U_list = processor.run_analytically()
+        assert_(len(U_list) == 3)
+        expected = U_list[0].full()
+        for U in U_list[1:]:
+            assert_allclose(U.full(), expected)
+        U_list[1].data.data[:] = 0.
+        assert_allclose(U_list[0].full(), expected)
+        assert_allclose(U_list[2].full(), expected)
+
+    def testRunStateAnalytically(self):
+        """
+        Test for the final state computed without propagators
+        """
+        processor = Processor(N=3)
+        processor.add_drift(sigmaz(), 1)
+        processor.add_control(sigmax(), cyclic_permutation=True)
+        processor.add_control(sigmay(), targets=2)
+        processor.add_control(sigmaz(), targets=0)
+        np.random.seed(0)
+        for pulse in processor.pulses:
+            pulse.tlist = np.linspace(0., 2., 11)
+            pulse.coeff = np.random.rand(10)
+        processor.pulses[-1].coeff = True
+
+        init_state = rand_ket(8, dims=[[2, 2, 2], [1, 1, 1]])
+        analytical_result = init_state
+        for unitary in processor.run_analytically():
+            analytical_result = unitary * analytical_result
+        for sparse_threshold in [0., 1.]:
+            final_state = processor.run_state_analytically(
+                init_state, sparse_threshold=sparse_threshold)
+            assert_allclose(
+                final_state.full(), analytical_result.full(), atol=1.e-10)
+
     def testChooseSolver(self):
         # setup and fidelity without noise
         init_state = qubit_states(2, [0, 0, 0, 0])
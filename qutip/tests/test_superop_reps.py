@@ -7,7 +7,8 @@ Created on Wed May 29 11:23:46 2013
 
 from __future__ import division
 
-from numpy import abs, pi, asarray, kron
+import pytest
+from numpy import abs, pi, eye, asarray, stack
 from numpy.linalg import norm
 from numpy.testing import assert_, assert_almost_equal, run_module_suite, assert_equal
 
@@ -25,6 +26,22 @@ from qutip.superoperator import operator_to_vector, vector_to_operator, sprepost
 
 tol = 1e-9
 
+# Qubit states and their three-qubit repetition code words.
+_ZERO = eye(2, dtype=complex)[:, [0]]
+_ONE = eye(2, dtype=complex)[:, [1]]
+_ZERO_LOG = eye(8, dtype=complex)[:, [0]]
+_ONE_LOG = eye(8, dtype=complex)[:, [7]]
+
+
+@pytest.fixture(scope="module")
+def bcsz_superops():
+    """
+    Random BCSZ superoperators keyed by dimension, generated once and shared
+    by the tests of this module.
+    """
+    return {N: [rand_super_bcsz(N) for _ in range(count)]
+            for N, count in [(2, 4), (4, 1), (7, 4), (8, 1)]}
+
 
 class TestSuperopReps(object):
     """
@@ -43,7 +60,7 @@ class TestSuperopReps(object):
 
         # Assert both that the result is close to expected, and has the right
         # type.
-        assert_((test_supe - superoperator).norm() < tol)
+        assert_(norm((test_supe - superoperator).full()) < tol)
         assert_(choi_matrix.type == "super" and choi_matrix.superrep == "choi")
         assert_(test_supe.type == "super" and test_supe.superrep == "super")
 
@@ -60,7 +77,7 @@ class TestSuperopReps(object):
 
         # Assert both that the result is close to expected, and has the right
         # type.
-        assert_((test_supe - superoperator).norm() < tol)
+        assert_(norm((test_supe - superoperator).full()) < tol)
         assert_(choi_matrix.type == "super" and choi_matrix.superrep == "choi")
         assert_(chi_matrix.type == "super" and chi_matrix.superrep == "chi")
         assert_(test_supe.type == "super" and test_supe.superrep == "super")
@@ -76,7 +93,7 @@ class TestSuperopReps(object):
 
         # Assert both that the result is close to expected, and has the right
         # type.
-        assert_((test_choi - choi_matrix).norm() < tol)
+        assert_(norm((test_choi - choi_matrix).full()) < tol)
         assert_(choi_matrix.type == "super" and choi_matrix.superrep == "choi")
         assert_(test_choi.type == "super" and test_choi.superrep == "choi")
 
@@ -84,12 +101,8 @@ class TestSuperopReps(object):
         """
         Superoperator: Convert non-square Kraus operator to Super + Choi matrix and back.
         """
-        zero = asarray([[1], [0]], dtype=complex)
-        one = asarray([[0], [1]], dtype=complex)
-        zero_log = kron(kron(zero, zero), zero)
-        one_log = kron(kron(one, one), one)
         # non-square Kraus operator (isometry)
-        kraus = Qobj(zero_log @ zero.T + one_log @ one.T)
+        kraus = Qobj(_ZERO_LOG @ _ZERO.T + _ONE_LOG @ _ONE.T)
         super = sprepost(kraus, kraus.dag())
         choi = to_choi(super)
         op1 = to_kraus(super)
@@ -97,27 +110,23 @@ class TestSuperopReps(object):
         op3 = to_super(choi)
         assert_(choi.type == "super" and choi.superrep == "choi")
         assert_(super.type == "super" and super.superrep == "super")
-        assert_((op1[0] - kraus).norm() < 1e-8)
-        assert_((op2[0] - kraus).norm() < 1e-8)
-        assert_((op3 - super).norm() < 1e-8)
+        assert_(norm((op1[0] - kraus).full()) < 1e-8)
+        assert_(norm((op2[0] - kraus).full()) < 1e-8)
+        assert_(norm((op3 - super).full()) < 1e-8)
 
     def test_NeglectSmallKraus(self):
         """
         Superoperator: Convert Kraus to Choi matrix and back. Neglect tiny Kraus operators.
         """
-        zero = asarray([[1], [0]], dtype=complex)
-        one = asarray([[0], [1]], dtype=complex)
-        zero_log = kron(kron(zero, zero), zero)
-        one_log = kron(kron(one, one), one)
         # non-square Kraus operator (isometry)
-        kraus = Qobj(zero_log @ zero.T + one_log @ one.T)
+        kraus = Qobj(_ZERO_LOG @ _ZERO.T + _ONE_LOG @ _ONE.T)
         super = sprepost(kraus, kraus.dag())
         # 1 non-zero Kraus operator the rest are zero
         sixteen_kraus_ops = to_kraus(super, tol=0.0)
         # default is tol=1e-9
         one_kraus_op = to_kraus(super)
         assert_(len(sixteen_kraus_ops) == 16 and len(one_kraus_op) == 1)
-        assert_((one_kraus_op[0] - kraus).norm() < tol)
+        assert_(norm((one_kraus_op[0] - kraus).full()) < tol)
 
     def test_SuperPreservesSelf(self):
         """
@@ -224,7 +233,7 @@ class TestSuperopReps(object):
         for dims in range(2, 5):
             assert_(abs(to_choi(identity(dims)).tr() - dims) <= tol)
 
-    def test_stinespring_cp(self, thresh=1e-10):
+    def test_stinespring_cp(self, bcsz_superops, thresh=1e-10):
         """
         Stinespring: A and B match for CP maps.
         """
@@ -232,10 +241,10 @@ class TestSuperopReps(object):
             A, B = to_stinespring(map)
             assert_(norm((A - B).full()) < thresh)
 
-        for idx in range(4):
-            case(rand_super_bcsz(7))
+        for map in bcsz_superops[7]:
+            case(map)
 
-    def test_stinespring_agrees(self, thresh=1e-10):
+    def test_stinespring_agrees(self, bcsz_superops, thresh=1e-10):
         """
         Stinespring: Partial Tr over pair agrees w/ supermatrix.
         """
@@ -250,10 +259,10 @@ class TestSuperopReps(object):
             #        ptraced!
             q2 = (A * state * B.dag()).ptrace((0,))
 
-            assert_((q1 - q2).norm('tr') <= thresh)
+            assert_(norm((q1 - q2).full()) <= thresh)
 
-        for idx in range(4):
-            case(rand_super_bcsz(2), rand_dm_ginibre(2))
+        for map in bcsz_superops[2]:
+            case(map, rand_dm_ginibre(2))
 
     def test_stinespring_dims(self):
         """
@@ -266,54 +275,52 @@ class TestSuperopReps(object):
         assert_equal(A.dims, [[2, 3, 1], [2, 3]])
         assert_equal(B.dims, [[2, 3, 1], [2, 3]])
 
-    def test_chi_choi_roundtrip(self):
+    def test_chi_choi_roundtrip(self, bcsz_superops):
         def case(qobj):
             qobj = to_chi(qobj)
             rt_qobj = to_chi(to_choi(qobj))
 
-            assert_almost_equal(rt_qobj.data.toarray(), qobj.data.toarray())
+            assert_((rt_qobj - qobj).norm('max') < tol)
             assert_equal(rt_qobj.type, qobj.type)
             assert_equal(rt_qobj.dims, qobj.dims)
 
         for N in (2, 4, 8):
-            case(rand_super_bcsz(N))
+            case(bcsz_superops[N][0])
 
     def test_chi_known(self):
         """
         Superoperator: Chi-matrix for known cases is correct.
         """
-        def case(S, chi_expected, silent=True):
-            chi_actual = to_chi(S)
-            chiq = Qobj(chi_expected, dims=[[[2], [2]], [[2], [2]]], superrep='chi')
-            if not silent:
-                print(chi_actual)
-                print(chi_expected)
-            assert_almost_equal((chi_actual - chiq).norm('tr'), 0)
-
-        case(sigmax(), [
-            [0, 0, 0, 0],
-            [0, 4, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0]
-        ])
-        case(to_super(sigmax()), [
+        chi_x = [
             [0, 0, 0, 0],
             [0, 4, 0, 0],
             [0, 0, 0, 0],
             [0, 0, 0, 0]
-        ])
-        case(qeye(2), [
-            [4, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0]
-        ])
-        case((-1j * sigmax() * pi / 4).expm(), [
-            [2, 2j, 0, 0],
-            [-2j, 2, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0]
-        ])
+        ]
+        cases = [
+            (sigmax(), chi_x),
+            (to_super(sigmax()), chi_x),
+            (qeye(2), [
+                [4, 0, 0, 0],
+                [0, 0, 0, 0],
+                [0, 0, 0, 0],
+                [0, 0, 0, 0]
+            ]),
+            ((-1j * sigmax() * pi / 4).expm(), [
+                [2, 2j, 0, 0],
+                [-2j, 2, 0, 0],
+                [0, 0, 0, 0],
+                [0, 0, 0, 0]
+            ]),
+        ]
+        chis = [to_chi(S) for S, _ in cases]
+        for chi in chis:
+            assert_equal(chi.superrep, 'chi')
+            assert_equal(chi.dims, [[[2], [2]], [[2], [2]]])
+        # Compare all cases at once.
+        assert_almost_equal(
+            stack([chi.full() for chi in chis]),
+            asarray([chi_expected for _, chi_expected in cases]))
 
 if __name__ == "__main__":
     run_module_suite()